@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from numerology.reduction import digit_sum, reduce_master
+
 def get_letter_value(letter):
     """Convert letter to numerological value using Pythagorean system"""
     letter_values = {
@@ -11,15 +13,7 @@ def get_letter_value(letter):
 
 def reduce_to_single_digit(number):
     """Reduce number to single digit, preserving master numbers 11, 22, 33"""
-    if number in [11, 22, 33]:
-        return number
-    
-    while number > 9:
-        number = sum(int(digit) for digit in str(number))
-        if number in [11, 22, 33]:
-            return number
-    
-    return number
+    return reduce_master(number)
 
 def calculate_life_path(birth_date):
     """Calculate Life Path number from birth date"""
@@ -39,7 +33,7 @@ def calculate_life_path(birth_date):
         reduced_day = reduce_to_single_digit(day)
         
         # Reduce year by adding all digits first, then reducing
-        year_sum = sum(int(digit) for digit in str(year))
+        year_sum = digit_sum(year)
         reduced_year = reduce_to_single_digit(year_sum)
         
         # Add the three reduced parts and reduce again
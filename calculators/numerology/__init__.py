@@ -0,0 +1,55 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# NUMEROLOGY ENGINE
+# The shared, importable core behind the date, calendar and year calculators:
+# the five date methods, their data tables and the day report.  Import it
+# in-process from your own pipelines instead of spawning a calculator:
+#
+#   from numerology import method_pythagorean, calculate_day
+#
+# The calculator scripts live next to this package, so running any of them
+# puts it on sys.path automatically; other callers add the calculators/
+# directory to PYTHONPATH.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Every name below is imported from its module on first use, so a script
+# pays only for the modules it reaches: `from numerology import
+# calculate_day` loads the report, never the query or distribution
+# machinery, and `from numerology.almanac import Almanac` loads nothing else.
+_EXPORTS = {
+    "data": (
+        "COMBINED_DATA", "GREEK_DATA", "HEBREW_DATA", "LETTER_VALUES", "MONTH_NAMES",
+        "letter_values", "lookup_hebrew",
+    ),
+    "methods": (
+        "HEBREW_SACRED_EXTENDED", "HEBREW_SACRED_STANDARD", "boneeh_steps", "boneeh_value",
+        "method_boneeh", "method_consensus", "method_full_component",
+        "method_hebrew_standard", "method_katan", "method_pythagorean", "method_synthesis",
+        "parse_date", "reduce_to_single_digit",
+    ),
+    "reduction": (
+        "MASTER_NUMBERS", "decimal_digits", "digit_sum", "digital_root",
+        "preserving_table", "reduce_master", "reduce_preserving",
+    ),
+    "days": ("Day", "iter_days", "iter_readings"),
+    "distribution": ("distributions",),
+    "hebrew": ("HebrewDate", "from_hebrew", "to_hebrew"),
+    "query": ("find_dates", "next_occurrence", "previous_occurrence"),
+    "readings": ("DateReading",),
+    "report": ("CompactCalendar", "DayReport", "calculate_day"),
+    "specs": ("BUILTIN_SPECS", "TIME_SPECS", "MethodSpec"),
+}
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+__all__ = tuple(_LAZY)
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'numerology' has no attribute '{name}'")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
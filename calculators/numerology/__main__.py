@@ -0,0 +1,187 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# ENGINE COMMAND LINE
+# Maintenance and analysis commands for the numerology engine.  Run from
+# calculators/:
+#
+#   python3 -m numerology build-sacred-index [--path PATH]
+#   python3 -m numerology build-almanac [--path PATH]
+#   python3 -m numerology runs METHOD [--value N] [--from DATE] [--to DATE]
+#                                     [--gaps | --period P] [--top N]
+#   python3 -m numerology agreement [--from DATE] [--to DATE] [--top N]
+# ─────────────────────────────────────────────────────────────────────────────
+
+import argparse
+import time
+from datetime import date
+
+
+def _build_sacred_index(args):
+    from .sacred import build_index
+    started = time.perf_counter()
+    path = build_index(args.path)
+    print(f"  Sacred-date index written to {path} "
+          f"({time.perf_counter() - started:.1f}s)")
+
+
+def _build_almanac(args):
+    from .almanac import build_almanac
+    started = time.perf_counter()
+    path = build_almanac(args.path)
+    print(f"  Packed almanac written to {path} "
+          f"({time.perf_counter() - started:.1f}s)")
+
+
+def _date_arg(text):
+    from .methods import parse_date
+    try:
+        m, d, y = parse_date(text)
+        return date(y, m, d)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _runs(args):
+    from .runs import gaps, longest_runs, patterns
+
+    start, end = args.start, args.end
+    if args.gaps:
+        title = f"LONGEST GAPS  ·  no {args.method} = {args.value}"
+        found = gaps(args.method, args.value, start, end, args.top)
+    elif args.period:
+        title = f"REPEATING PATTERNS  ·  {args.method}, every {args.period} days"
+        found = patterns(args.method, start, end, args.period, top=args.top)
+    else:
+        title = f"LONGEST RUNS  ·  {args.method}"
+        if args.value is not None:
+            title += f" = {args.value}"
+        found = longest_runs(args.method, start, end, args.value, args.top)
+
+    print()
+    print(f"  {title}  ·  {start:%m-%d-%Y} to {end:%m-%d-%Y}")
+    print("  " + "─" * 68)
+    for run in found:
+        if run.value is None:
+            value = ""
+        elif isinstance(run.value, tuple):
+            value = " ".join(map(str, run.value))
+        else:
+            value = str(run.value)
+        days = "day " if run.length == 1 else "days"
+        line = f"  {run.start:%m-%d-%Y} → {run.end:%m-%d-%Y}  {run.length:>6} {days}   {value}"
+        print(line.rstrip())
+    if not found:
+        print("  (none)")
+    print("  " + "─" * 68)
+    print()
+
+
+_SHORT_NAMES = ("Greek", "Hebrew", "Katan", "Gadol", "Bone'eh")
+
+
+def _agreement(args):
+    import numpy as np
+    from .agreement import Agreement
+
+    start, end = args.start, args.end
+    a = Agreement.for_range(start, end)
+
+    print()
+    print(f"  METHOD AGREEMENT  ·  {start:%m-%d-%Y} to {end:%m-%d-%Y}  ·  {len(a):,} days")
+    print("  " + "─" * 68)
+    print("  " + " " * 9 + "".join(f"{name:>8} " for name in _SHORT_NAMES).rstrip())
+    for name, shares in zip(_SHORT_NAMES, a.matrix()):
+        print(f"  {name:<9}" + "".join(f"{share:>8.1%} " for share in shares).rstrip())
+    print("  " + "─" * 68)
+    _, counts = a.consensus()
+    for n, days in enumerate(np.bincount(counts, minlength=6).tolist()):
+        if n:
+            print(f"  {n} of 5 agree   {days:>10,} days  {days / len(a):>7.2%}")
+    print("  " + "─" * 68)
+    print(f"  RAREST COMBINATIONS  ·  {'  '.join(_SHORT_NAMES)}")
+    for c in a.rarest(args.top):
+        finals = "  ".join(f"{v:>{len(name)}}" for name, v in zip(_SHORT_NAMES, c.finals))
+        first = a.dates_of(c)[0]
+        print(f"  {c.days:>6,} {'day ' if c.days == 1 else 'days'}  {finals}   "
+              f"first {first:%m-%d-%Y}")
+    print("  " + "─" * 68)
+    print()
+
+
+def main(argv=None):
+    from .almanac import DEFAULT_ALMANAC_PATH
+    from .sacred import DEFAULT_INDEX_PATH
+    from .table import METHODS
+
+    parser = argparse.ArgumentParser(
+        prog="python3 -m numerology",
+        description="Maintenance and analysis commands for the numerology engine.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build-sacred-index",
+        help="index every 0001-9999 date where a method preserves a sacred sum",
+    )
+    build.add_argument("--path", default=DEFAULT_INDEX_PATH,
+                       help=f"where to write the index (default: {DEFAULT_INDEX_PATH})")
+    build.set_defaults(run=_build_sacred_index)
+
+    almanac = commands.add_parser(
+        "build-almanac",
+        help="pack every method's final value for every 0001-9999 date into one "
+             "memory-mapped file",
+    )
+    almanac.add_argument("--path", default=DEFAULT_ALMANAC_PATH,
+                         help=f"where to write the almanac (default: {DEFAULT_ALMANAC_PATH})")
+    almanac.set_defaults(run=_build_almanac)
+
+    runs = commands.add_parser(
+        "runs",
+        help="longest runs, gaps or repeating patterns of a method over a date range "
+             "(requires NumPy)",
+    )
+    runs.add_argument("method", choices=METHODS)
+    runs.add_argument("--value", type=int,
+                      help="only runs of this value (required with --gaps)")
+    runs.add_argument("--from", dest="start", type=_date_arg, metavar="MM-DD-YYYY",
+                      help="first day (default: 1 January this year)")
+    runs.add_argument("--to", dest="end", type=_date_arg, metavar="MM-DD-YYYY",
+                      help="last day (default: 31 December of the first day's year)")
+    mode = runs.add_mutually_exclusive_group()
+    mode.add_argument("--gaps", action="store_true",
+                      help="stretches with no day equal to --value")
+    mode.add_argument("--period", type=int, metavar="P",
+                      help="stretches where a P-day motif repeats")
+    runs.add_argument("--top", type=int, default=10,
+                      help="how many to list, longest first (default: 10)")
+    runs.set_defaults(run=_runs)
+
+    agreement = commands.add_parser(
+        "agreement",
+        help="how often the five methods agree over a date range, and their rarest "
+             "combinations (requires NumPy)",
+    )
+    agreement.add_argument("--from", dest="start", type=_date_arg, metavar="MM-DD-YYYY",
+                           help="first day (default: 1 January this year)")
+    agreement.add_argument("--to", dest="end", type=_date_arg, metavar="MM-DD-YYYY",
+                           help="last day (default: 31 December of the first day's year)")
+    agreement.add_argument("--top", type=int, default=10,
+                           help="how many of the rarest combinations to list (default: 10)")
+    agreement.set_defaults(run=_agreement)
+
+    args = parser.parse_args(argv)
+    if args.command in ("runs", "agreement"):
+        args.start = args.start or date(date.today().year, 1, 1)
+        args.end = args.end or date(args.start.year, 12, 31)
+        if args.end < args.start:
+            parser.error("--to must not be before --from")
+    if args.command == "runs":
+        if args.gaps and args.value is None:
+            parser.error("--gaps needs --value")
+        if args.period is not None and args.period < 2:
+            parser.error("--period must be at least 2")
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
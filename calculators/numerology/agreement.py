@@ -0,0 +1,140 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# METHOD AGREEMENT  (requires NumPy)
+# How often the five date methods agree, and which combinations of their
+# final values are rarest, over any date range:
+#
+#   a = Agreement.for_range(date(1900, 1, 1), date(2099, 12, 31))
+#   a.matrix()          # 5 x 5 share of days on which each pair agrees
+#   a.rarest(10)        # the ten least common (greek, hebrew, ...) combinations
+#   a.rarity()          # per day: how surprising its combination is, in bits
+#   a.consensus()       # per day: the most shared value and how many share it
+#
+# The five final-value columns are gathered once (numerology.columns) and
+# every statistic is a vectorized pass over them: pairwise equality for
+# the matrix, and each day's combination packed into one integer so a
+# single sort counts them all.  Methods agree only on equal values, so a
+# preserved sacred sum (18) does not agree with its root (9).  Also
+# available from the command line:
+#
+#   python3 -m numerology agreement --from 01-01-1900 --to 12-31-2099
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from .columns import ReadingColumns
+from .table import METHODS
+
+
+# The synthesis is derived from two of the five, so it is left out
+AGREEMENT_METHODS = METHODS[:5]
+
+# Bits for each method's final value in a packed combination; the first
+# method takes the highest bits, so packed order is value order
+_BITS = 7
+_SHIFTS = tuple(_BITS * i for i in reversed(range(len(AGREEMENT_METHODS))))
+
+
+class Combination(namedtuple("Combination", AGREEMENT_METHODS + ("days", "share"))):
+    """One combination of the five final values, with how often it occurs."""
+
+    __slots__ = ()
+
+    @property
+    def finals(self):
+        return tuple(self[:len(AGREEMENT_METHODS)])
+
+
+def consensus(finals):
+    """
+    (values, counts) per row of an (n, 5) array of final values: the value
+    reached by the most methods and how many reach it, as
+    methods.method_consensus does for one date.
+    """
+    finals = np.asarray(finals)
+    shared = (finals[:, :, None] == finals[:, None, :]).sum(axis=2)
+    counts = shared.max(axis=1)
+    # Ties go to the smaller value
+    values = np.where(shared == counts[:, None], finals, np.iinfo(finals.dtype).max).min(axis=1)
+    return values, counts
+
+
+class Agreement:
+    """Agreement between the five methods over a run of consecutive days."""
+
+    def __init__(self, finals, first=None):
+        self.finals = np.asarray(finals)
+        if self.finals.ndim != 2 or self.finals.shape[1] != len(AGREEMENT_METHODS):
+            raise ValueError(f"Expected one column per method: {', '.join(AGREEMENT_METHODS)}.")
+        self.first = first
+        self._combinations = None
+
+    @classmethod
+    def for_range(cls, start, end):
+        """Agreement over every date from start to end (datetime.date), inclusive."""
+        if start > end:
+            raise ValueError("The range must start on or before its last day.")
+        columns = ReadingColumns.for_range(start, end)
+        return cls(np.column_stack([getattr(columns, m) for m in AGREEMENT_METHODS]), start)
+
+    def __len__(self):
+        return len(self.finals)
+
+    def matrix(self):
+        """
+        5 x 5 array: the share of days on which the row and column methods
+        give the same final value, in AGREEMENT_METHODS order.
+        """
+        n = len(AGREEMENT_METHODS)
+        shares = np.eye(n)
+        if not len(self):
+            return shares
+        for i in range(n):
+            for j in range(i + 1, n):
+                shares[i, j] = shares[j, i] = np.mean(self.finals[:, i] == self.finals[:, j])
+        return shares
+
+    def consensus(self):
+        """(values, counts) arrays: each day's consensus, see consensus()."""
+        return consensus(self.finals)
+
+    def _counted(self):
+        """(keys, inverse, counts): each day's packed combination, counted."""
+        if self._combinations is None:
+            keys = np.zeros(len(self), dtype=np.int64)
+            for i, shift in enumerate(_SHIFTS):
+                keys |= self.finals[:, i].astype(np.int64) << shift
+            self._combinations = np.unique(keys, return_inverse=True, return_counts=True)
+        return self._combinations
+
+    def combinations(self):
+        """Every combination that occurs, rarest first (ties in value order)."""
+        keys, _, counts = self._counted()
+        total = len(self)
+        mask = (1 << _BITS) - 1
+        order = np.argsort(counts, kind="stable")
+        return [Combination(*((key >> shift) & mask for shift in _SHIFTS), count, count / total)
+                for key, count in zip(keys[order].tolist(), counts[order].tolist())]
+
+    def rarest(self, top=10):
+        """The `top` least common combinations."""
+        return self.combinations()[:top]
+
+    def dates_of(self, finals):
+        """Every date whose five final values are `finals` (or a Combination)."""
+        if self.first is None:
+            raise ValueError("Dates need an Agreement built with for_range().")
+        finals = tuple(finals)[:len(AGREEMENT_METHODS)]
+        rows = np.flatnonzero((self.finals == finals).all(axis=1))
+        first = self.first.toordinal()
+        return [date.fromordinal(first + i) for i in rows.tolist()]
+
+    def rarity(self):
+        """
+        Per day, -log2 of the share of days with the same combination: 0
+        for a combination every day shares, one more bit for each halving.
+        """
+        _, inverse, counts = self._counted()
+        return np.log2(len(self) / counts)[inverse.ravel()]
@@ -0,0 +1,208 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# PACKED ALMANAC
+# Every method's final value and the synthesis for every date in 0001-9999,
+# bit-packed into one 32-bit record per day, written once to disk and
+# memory-mapped by readers:
+#
+#   python3 -m numerology build-almanac            (writes DEFAULT_ALMANAC_PATH)
+#
+#   with Almanac.open() as almanac:
+#       almanac.get(date(2026, 2, 28))      # AlmanacEntry(pythagorean=4, ...)
+#       almanac.final("katan", date(2026, 2, 28))
+#
+# File layout (native byte order, recorded in the header):
+#   header   MAGIC, byte order, ordinal of the first day, number of days
+#   records  one uint32 per day from the first day on, starting at the next
+#            8-byte boundary; fields packed low bit first as in _LAYOUT
+#
+# A lookup is one index by day ordinal into the mapping: opening the file
+# reads only the header, the OS pages records in as they are touched, and
+# every process that maps the file shares the same cached pages.
+# ─────────────────────────────────────────────────────────────────────────────
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from datetime import date
+from types import MappingProxyType
+
+
+DEFAULT_ALMANAC_PATH = os.path.join(
+    os.path.expanduser("~"), ".numerology", "almanac.bin")
+
+MAGIC = b"NUMALMN1"
+_HEADER = struct.Struct("=8s8sII")     # magic, byte order, first ordinal, days
+
+# (method, bits): Greek, Bone'eh and the synthesis are 1-9; Hebrew Standard
+# keeps 13, 18 and 26; Mispar Katan and Full Component keep up to 70.
+_LAYOUT = (
+    ("pythagorean",     4),
+    ("hebrew_standard", 5),
+    ("katan",           7),
+    ("full_component",  7),
+    ("boneeh",          4),
+    ("synthesis",       4),
+)
+
+
+def _positions(layout):
+    """method -> (shift, mask) of its field in a record."""
+    fields, shift = {}, 0
+    for method, bits in layout:
+        fields[method] = (shift, (1 << bits) - 1)
+        shift += bits
+    return MappingProxyType(fields)
+
+
+_FIELDS = _positions(_LAYOUT)
+
+# The packed methods, in numerology.table.METHODS order; readers never
+# import the table itself
+_METHODS = tuple(method for method, _ in _LAYOUT)
+
+_FIRST = date(1, 1, 1)
+_LAST = date(9999, 12, 31)
+
+
+class AlmanacEntry(namedtuple("AlmanacEntry", _METHODS)):
+    """Every method's final value for one day, unpacked from its record."""
+
+    __slots__ = ()
+
+
+def _data_start():
+    return (_HEADER.size + 7) // 8 * 8
+
+
+def pack(finals):
+    """One 32-bit record from a method -> final value mapping."""
+    word = 0
+    for method, (shift, mask) in _FIELDS.items():
+        value = finals[method]
+        if not 0 <= value <= mask:
+            raise ValueError(f"{method} value {value} does not fit the almanac record.")
+        word |= value << shift
+    return word
+
+
+def unpack(word):
+    """The AlmanacEntry packed into one record."""
+    return AlmanacEntry(*((word >> shift) & mask for shift, mask in _FIELDS.values()))
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _year_records(ds, leap):
+    """The records of every day of a year with digit sum ds, 1 January first."""
+    from .dates import days_in_month
+    from .table import lookup_ds
+
+    year = 2000 if leap else 2001     # any year with the right month lengths
+    records = array("I")
+    for month in range(1, 13):
+        for day in range(1, days_in_month(year, month) + 1):
+            e = lookup_ds(month, day, ds)
+            records.append(pack({method: e.final(method) for method in _METHODS}))
+    return records
+
+
+def build_almanac(path=DEFAULT_ALMANAC_PATH):
+    """Compute every date in 0001-9999 and write the packed almanac to path."""
+    from .dates import is_leap
+    from .table import MAX_DIGIT_SUM, year_digit_sum
+
+    # A year's records depend only on its digit sum and whether it is leap
+    years = {(ds, leap): _year_records(ds, leap)
+             for ds in range(MAX_DIGIT_SUM + 1) for leap in (False, True)}
+    records = array("I")
+    for year in range(_FIRST.year, _LAST.year + 1):
+        records.extend(years[(year_digit_sum(year), is_leap(year))])
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, sys.byteorder.encode(), _FIRST.toordinal(), len(records)))
+        fh.write(b"\0" * (_data_start() - fh.tell()))
+        records.tofile(fh)
+    os.replace(tmp_path, path)   # readers never see a half-written almanac
+    return path
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+class Almanac:
+    """Read-only, memory-mapped view of a packed almanac file."""
+
+    def __init__(self, path=DEFAULT_ALMANAC_PATH):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder, self._first, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a packed almanac.")
+        if byteorder.rstrip(b"\0").decode() != sys.byteorder:
+            raise ValueError(f"{path} was built on a machine with another byte "
+                             f"order; rebuild it here.")
+        self._records = memoryview(self._map)[_data_start():].cast("I")
+        if len(self._records) < self._count:
+            raise ValueError(f"{path} is truncated; rebuild it.")
+
+    @classmethod
+    def open(cls, path=DEFAULT_ALMANAC_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"No almanac at {path}. "
+                f"Build one with: python3 -m numerology build-almanac")
+        return cls(path)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def first(self):
+        return date.fromordinal(self._first)
+
+    @property
+    def last(self):
+        return date.fromordinal(self._first + self._count - 1)
+
+    def _record(self, ordinal):
+        i = ordinal - self._first
+        if not 0 <= i < self._count:
+            raise KeyError(f"Day {ordinal} is outside the almanac "
+                           f"({self.first} to {self.last}).")
+        return self._records[i]
+
+    def at(self, ordinal):
+        """The AlmanacEntry of a day given by its ordinal (date.toordinal())."""
+        return unpack(self._record(ordinal))
+
+    def get(self, day):
+        """The AlmanacEntry of a datetime.date."""
+        return self.at(day.toordinal())
+
+    def final(self, method, day):
+        """One method's final value for a datetime.date, without unpacking the rest."""
+        if method not in _FIELDS:
+            raise ValueError(f"Unknown method: {method}. Use one of {', '.join(_METHODS)}.")
+        shift, mask = _FIELDS[method]
+        return (self._record(day.toordinal()) >> shift) & mask
+
+    def close(self):
+        self._records.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,254 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# BATCH EVALUATION  (requires NumPy)
+# All five date methods and the synthesis over whole arrays of dates at once,
+# using vectorized integer arithmetic instead of a Python loop per date.
+#
+#   from numerology.batch import evaluate
+#   r = evaluate(months, days, years)       # one structured row per date
+#   r["katan"], r["boneeh_step3"], r["synthesis"], ...
+#
+# Every field matches the corresponding value returned by the scalar
+# method_* functions in numerology.methods exactly.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from threading import Lock
+
+import numpy as np
+
+from .methods import HEBREW_SACRED_EXTENDED, HEBREW_SACRED_STANDARD
+from .reduction import TABLE_SIZE, _DIGIT_SUM, preserving_table
+from .table import MAX_DIGIT_SUM, representative_years
+
+
+BATCH_DTYPE = np.dtype([
+    ("month",           np.int16),
+    ("day",             np.int16),
+    ("year",            np.int64),
+    # Methods 1, 2 and 5 share the reduced components
+    ("r_month",         np.int8),
+    ("r_day",           np.int8),
+    ("r_year",          np.int8),
+    # Methods 1 and 2 share the raw sum
+    ("raw_sum",         np.int8),
+    ("pythagorean",     np.int8),
+    ("hebrew_standard", np.int8),
+    ("katan_raw",       np.int16),
+    ("katan",           np.int16),
+    ("year_digit_sum",  np.int16),
+    ("full_raw",        np.int16),
+    ("full_component",  np.int16),
+    ("boneeh_step1",    np.int8),
+    ("boneeh_step2",    np.int8),
+    ("boneeh_step3",    np.int8),
+    ("boneeh",          np.int8),
+    ("synthesis",       np.int8),
+])
+
+_STANDARD_TABLE = np.array(preserving_table(HEBREW_SACRED_STANDARD), dtype=np.int64)
+_EXTENDED_TABLE = np.array(preserving_table(HEBREW_SACRED_EXTENDED), dtype=np.int64)
+_DIGIT_SUM_TABLE = np.array(_DIGIT_SUM, dtype=np.int64)
+for _lookup in (_STANDARD_TABLE, _EXTENDED_TABLE, _DIGIT_SUM_TABLE):
+    _lookup.flags.writeable = False
+
+
+# =============================================================================
+# VECTOR PRIMITIVES
+# =============================================================================
+
+def digit_sums(values):
+    """Element-wise decimal digit sum of a non-negative integer array."""
+    values = np.array(values, dtype=np.int64)
+    if (values < 0).any():
+        raise ValueError("Digit sums need non-negative integers.")
+    total = _DIGIT_SUM_TABLE[values % TABLE_SIZE]
+    values //= TABLE_SIZE
+    while values.any():
+        total += _DIGIT_SUM_TABLE[values % TABLE_SIZE]
+        values //= TABLE_SIZE
+    return total
+
+
+def digital_roots(values):
+    """Element-wise digital root (closed form, 0 stays 0)."""
+    values = np.asarray(values, dtype=np.int64)
+    return np.where(values > 9, 1 + (values - 1) % 9, values)
+
+
+def reduce_preserving(values, table):
+    """Element-wise reduce_preserving against a table from preserving_table."""
+    values = np.asarray(values, dtype=np.int64)
+    table = np.asarray(table, dtype=np.int64)
+    inside = values < len(table)
+    return np.where(inside, table[np.where(inside, values, 0)], digital_roots(values))
+
+
+# =============================================================================
+# BONE'EH OVER SEQUENCES
+# Many sequences of any length packed end to end in one flat array, with
+# their lengths alongside.  Running totals are two cumulative sums over the
+# whole array, each corrected by what it had reached when a sequence began.
+# =============================================================================
+
+def _restart(totals, lengths):
+    """Cumulative totals made to restart from zero at each sequence."""
+    starts = np.cumsum(lengths) - lengths
+    carried = np.concatenate(([0], totals))[starts]
+    return totals - np.repeat(carried, lengths)
+
+
+def boneeh_steps(values, lengths=None):
+    """
+    Bone'eh running totals for many sequences at once.  With lengths, values
+    is the sequences concatenated and the result lines up with it; without,
+    each row of a 2-D array (or a 1-D array as a whole) is one sequence.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if lengths is None:
+        return np.cumsum(np.cumsum(values, axis=-1), axis=-1)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if lengths.sum() != len(values):
+        raise ValueError("The lengths must add up to the number of values.")
+    return _restart(np.cumsum(_restart(np.cumsum(values), lengths)), lengths)
+
+
+def boneeh_totals(values, lengths=None):
+    """Last bone'eh running total of each sequence (0 for an empty one)."""
+    if lengths is None:
+        return boneeh_steps(values)[..., -1]
+    lengths = np.asarray(lengths, dtype=np.int64)
+    steps = boneeh_steps(values, lengths)
+    totals = np.zeros(len(lengths), dtype=np.int64)
+    nonempty = lengths > 0
+    totals[nonempty] = steps[np.cumsum(lengths)[nonempty] - 1]
+    return totals
+
+
+# =============================================================================
+# BATCH EVALUATION
+# =============================================================================
+
+def evaluate(month, day, year):
+    """
+    Evaluate every method for arrays of (month, day, year).
+    The three arguments broadcast against each other; the result is a
+    one-dimensional structured array with dtype BATCH_DTYPE.
+    """
+    month, day, year = (np.ravel(a).astype(np.int64)
+                        for a in np.broadcast_arrays(month, day, year))
+    out = np.empty(len(month), dtype=BATCH_DTYPE)
+    out["month"], out["day"], out["year"] = month, day, year
+
+    year_ds = digit_sums(year)
+    rm, rd, ry = digital_roots(month), digital_roots(day), digital_roots(year_ds)
+    out["r_month"], out["r_day"], out["r_year"] = rm, rd, ry
+
+    # Methods 1 and 2: reduced components, summed
+    raw = rm + rd + ry
+    greek = digital_roots(raw)
+    hebrew = reduce_preserving(raw, _STANDARD_TABLE)
+    out["raw_sum"], out["pythagorean"], out["hebrew_standard"] = raw, greek, hebrew
+
+    # Method 3: every digit of MMDDYYYY
+    katan_raw = digit_sums(month) + digit_sums(day) + year_ds
+    out["katan_raw"] = katan_raw
+    out["katan"] = reduce_preserving(katan_raw, _EXTENDED_TABLE)
+
+    # Method 4: month and day at face value plus the year digit sum
+    full_raw = month + day + year_ds
+    out["year_digit_sum"], out["full_raw"] = year_ds, full_raw
+    out["full_component"] = reduce_preserving(full_raw, _EXTENDED_TABLE)
+
+    # Method 5: bone'eh running totals m, 2m + d, 3m + 2d + y
+    step2 = 2 * rm + rd
+    step3 = step2 + rm + rd + ry
+    out["boneeh_step1"], out["boneeh_step2"], out["boneeh_step3"] = rm, step2, step3
+    out["boneeh"] = digital_roots(step3)
+
+    out["synthesis"] = digital_roots(greek + digital_roots(hebrew))
+    return out
+
+
+# =============================================================================
+# TABLE LOOKUP
+# The same (month, day, year-digit-sum) table as numerology.table, held as a
+# structured array so whole batches are answered by fancy indexing.
+# =============================================================================
+
+_GRID = None
+_GRID_LOCK = Lock()
+
+
+def _grid():
+    global _GRID
+    if _GRID is None:
+        with _GRID_LOCK:
+            if _GRID is None:
+                month, day, ds = np.meshgrid(np.arange(1, 13), np.arange(1, 32),
+                                             np.arange(MAX_DIGIT_SUM + 1), indexing="ij")
+                years = np.array(representative_years(), dtype=np.int64)[ds]
+                grid = evaluate(month, day, years).reshape(month.shape)
+                grid.flags.writeable = False
+                _GRID = grid
+    return _GRID
+
+
+def _table_dates(month, day, year):
+    """Broadcast and flatten (month, day, year), checking each lies in the table."""
+    month, day, year = (np.ravel(a).astype(np.int64)
+                        for a in np.broadcast_arrays(month, day, year))
+    if ((month < 1) | (month > 12)).any():
+        raise ValueError("Month must be 1-12.")
+    if ((day < 1) | (day > 31)).any():
+        raise ValueError("Day must be 1-31.")
+    return month, day, year
+
+
+def lookup(month, day, year):
+    """
+    Same result as evaluate(), answered from the precomputed table: one
+    digit-sum pass over the years, then a single gather.  Month must be
+    1-12 and day 1-31; rows whose year digit sum lies beyond the table
+    are evaluated directly.
+    """
+    month, day, year = _table_dates(month, day, year)
+    ds = digit_sums(year)
+    beyond = ds > MAX_DIGIT_SUM
+    out = _grid()[month - 1, day - 1, np.where(beyond, 0, ds)]
+    out["year"] = year
+    out["year_digit_sum"] = ds
+    if beyond.any():
+        out[beyond] = evaluate(month[beyond], day[beyond], year[beyond])
+    return out
+
+
+class LazyLookup:
+    """
+    The same values as lookup(), one field at a time: the table indexes
+    are computed once and each field() is a single gather of that field
+    alone, so a caller needing one method never touches the others.
+    """
+
+    def __init__(self, month, day, year):
+        self.month, self.day, self.year = _table_dates(month, day, year)
+        self.year_digit_sum = digit_sums(self.year)
+        self._beyond = self.year_digit_sum > MAX_DIGIT_SUM
+        self._index = (self.month - 1, self.day - 1,
+                       np.where(self._beyond, 0, self.year_digit_sum))
+        self._evaluated = None
+
+    def __len__(self):
+        return len(self.month)
+
+    def field(self, name):
+        """One BATCH_DTYPE field for every date, as an int64 array."""
+        if name in ("month", "day", "year", "year_digit_sum"):
+            return getattr(self, name)
+        if name not in BATCH_DTYPE.names:
+            raise ValueError(f"Unknown field: {name}.")
+        out = _grid()[name][self._index].astype(np.int64)
+        if self._beyond.any():
+            if self._evaluated is None:
+                b = self._beyond
+                self._evaluated = evaluate(self.month[b], self.day[b], self.year[b])
+            out[self._beyond] = self._evaluated[name]
+        return out
@@ -0,0 +1,514 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# ENGINE BENCHMARKS
+# Micro-benchmarks comparing the engine against the code it replaced.
+# Run from the calculators/ directory:
+#
+#   python3 -m numerology.benchmarks             (every benchmark)
+#   python3 -m numerology.benchmarks reduction   (just one)
+# ─────────────────────────────────────────────────────────────────────────────
+
+import argparse
+import re
+import timeit
+
+from .reduction import (
+    TABLE_SIZE, decimal_digits, digit_sum, digital_root, preserving_table,
+    reduce_master, reduce_preserving,
+)
+
+
+def _best_of(fn, repeat=5, number=1):
+    """Best wall time of `repeat` runs of fn, in seconds per call."""
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def _report(title, rows):
+    print()
+    print(f"  {title}")
+    print("  " + "─" * 68)
+    print(f"  {'CASE':<30}  {'BEFORE':>10}  {'AFTER':>10}  {'SPEEDUP':>10}")
+    print("  " + "─" * 68)
+    for label, before, after in rows:
+        print(f"  {label:<30}  {before * 1e3:>8.2f}ms  {after * 1e3:>8.2f}ms  "
+              f"{before / after:>9.1f}x")
+    print("  " + "─" * 68)
+
+
+# =============================================================================
+# REDUCTION
+# =============================================================================
+
+def _legacy_digit_sum(n):
+    return sum(int(d) for d in str(n))
+
+
+def _legacy_reduce(n):
+    while n > 9:
+        n = sum(int(d) for d in str(n))
+    return n
+
+
+def _legacy_reduce_master(n):
+    if n in [11, 22, 33]:
+        return n
+    while n > 9:
+        n = sum(int(d) for d in str(n))
+        if n in [11, 22, 33]:
+            return n
+    return n
+
+
+def _legacy_reduce_sacred(n, sacred):
+    if n in sacred:
+        return n
+    return _legacy_reduce(n)
+
+
+def _legacy_date_digits(month, day, year):
+    return [int(c) for c in f"{month:02d}{day:02d}{year:04d}"]
+
+
+def bench_reduction():
+    """Table-driven reduction vs the old str/int round trips."""
+    years = range(1, 10000)
+    raws = list(range(3, 80)) * 130
+    sacred = {13, 18, 26, 36, 40, 49, 50, 70}
+    table = preserving_table(sacred)
+
+    cases = [
+        ("digit sum (years 1-9999)",
+         lambda: [_legacy_digit_sum(y) for y in years],
+         lambda: [digit_sum(y) for y in years]),
+        ("digital root (1-9999)",
+         lambda: [_legacy_reduce(y) for y in years],
+         lambda: [digital_root(y) for y in years]),
+        ("master 11/22/33 (1-9999)",
+         lambda: [_legacy_reduce_master(y) for y in years],
+         lambda: [reduce_master(y) for y in years]),
+        ("sacred-preserving (raw sums)",
+         lambda: [_legacy_reduce_sacred(n, sacred) for n in raws],
+         lambda: [reduce_preserving(n, table) for n in raws]),
+        ("katan digits (years 1-9999)",
+         lambda: [_legacy_date_digits(12, 31, y) for y in years],
+         lambda: [decimal_digits(12, 2) + decimal_digits(31, 2) + decimal_digits(y, 4)
+                  for y in years]),
+    ]
+    rows = []
+    for label, before, after in cases:
+        assert before() == after(), label
+        rows.append((label, _best_of(before), _best_of(after)))
+    _report("REDUCTION  ·  10,000 calls per case", rows)
+
+
+def _chunked_digit_sum(n):
+    """The engine's previous digit sum: one base-10000 chunk at a time."""
+    total = 0
+    while n:
+        n, chunk = divmod(n, TABLE_SIZE)
+        total += digit_sum(chunk)
+    return total
+
+
+def bench_huge():
+    """Digit sums of astronomical-scale years: halving vs str() and chunk loops."""
+    year = 10 ** 4000 // 7
+    rows = [("digit sum, 4,000 digits (str)",
+             _best_of(lambda: _legacy_digit_sum(year)),
+             _best_of(lambda: digit_sum(year)))]
+    for digits in (10_000, 100_000):
+        year = 10 ** digits // 7
+        assert _chunked_digit_sum(year) == digit_sum(year)
+        rows.append((f"digit sum, {digits:,} digits",
+                     _best_of(lambda: _chunked_digit_sum(year), repeat=3),
+                     _best_of(lambda: digit_sum(year), repeat=3)))
+    _report("HUGE YEARS  ·  one call per case", rows)
+
+
+# =============================================================================
+# BITMAP QUERIES
+# =============================================================================
+
+def bench_bitmaps():
+    """Compound date search: bitmap ANDs vs re-running the methods per date."""
+    from datetime import date, timedelta
+    from .bitmaps import DateBitmapIndex
+    from .methods import (
+        HEBREW_SACRED_EXTENDED, method_boneeh, method_katan, method_pythagorean,
+    )
+
+    index = DateBitmapIndex(date(1900, 1, 1), date(2099, 12, 31))
+    rows = []
+    for first, last in ((2025, 2035), (1900, 2099)):
+        start, end = date(first, 1, 1), date(last, 12, 31)
+        days = [start + timedelta(n) for n in range((end - start).days + 1)]
+
+        def before():
+            return [d for d in days
+                    if method_pythagorean(d.month, d.day, d.year)[4] == 9
+                    and method_katan(d.month, d.day, d.year)[2] in HEBREW_SACRED_EXTENDED
+                    and method_boneeh(d.month, d.day, d.year)[4] == 9]
+
+        def after():
+            hits = (index.bitmap("pythagorean", 9) & index.sacred("katan")
+                    & index.bitmap("boneeh", 9) & index.between(start, end))
+            return list(hits.dates())
+
+        assert before() == after(), (first, last)
+        rows.append((f"{first}-{last} ({last - first + 1} years)",
+                     _best_of(before, repeat=3), _best_of(after)))
+    _report("BITMAP QUERIES  ·  Greek 9 AND Katan sacred AND Bone'eh 9", rows)
+
+
+# =============================================================================
+# DAY STREAMS
+# =============================================================================
+
+def bench_days():
+    """A year of readings: the day stream vs looking each date up afresh."""
+    from .dates import days_in_month
+    from .days import iter_readings
+    from .readings import DateReading
+
+    rows = []
+    for label, year in (("year 2026", 2026), ("year of 1,000 digits", 10 ** 1000 // 7)):
+        # Readings are lazy, so both sides read a field to force the lookup
+        def before():
+            return [DateReading.of(m, d, year).synthesis
+                    for m in range(1, 13) for d in range(1, days_in_month(year, m) + 1)]
+
+        def after():
+            return [r.synthesis for r in iter_readings((year, 1, 1), (year, 12, 31))]
+
+        assert before() == after(), label
+        rows.append((label, _best_of(before), _best_of(after)))
+    _report("DAY STREAMS  ·  every reading of one year", rows)
+
+
+def bench_dates():
+    """Date arrays of 0001-9999: nested month loops vs day-number arithmetic."""
+    import calendar
+    from datetime import date
+    import numpy as np
+    from .dates import date_range
+
+    def before():
+        month, day, year = [], [], []
+        for y in range(1, 10000):
+            for m in range(1, 13):
+                for d in range(1, calendar.monthrange(y, m)[1] + 1):
+                    month.append(m)
+                    day.append(d)
+                    year.append(y)
+        return np.array(month), np.array(day), np.array(year)
+
+    def after():
+        return date_range(date(1, 1, 1), date(9999, 12, 31))[:3]
+
+    assert all(np.array_equal(a, b) for a, b in zip(before(), after()))
+    _report("DATE RANGES  ·  month, day and year of every date",
+            [("0001-9999 (3,652,059 dates)", _best_of(before, repeat=3), _best_of(after))])
+
+
+# =============================================================================
+# LAZY READINGS
+# =============================================================================
+
+def _eager_reading(month, day, year):
+    """A DateReading with every field unpacked up front, as before."""
+    from .readings import DateReading
+    from .table import lookup
+
+    e = lookup(month, day, year)
+    rm, rd, ry, raw, greek = e.pythagorean
+    katan_raw, katan = e.katan
+    _, _, year_ds, full_raw, full = e.full_component
+    _, _, _, (s1, s2, s3), boneeh = e.boneeh
+    return DateReading(month, day, year, rm, rd, ry, raw, greek, e.hebrew_standard[4],
+                       katan_raw, katan, year_ds, full_raw, full, s1, s2, s3, boneeh,
+                       e.synthesis)
+
+
+def bench_readings():
+    """Narrow workloads: one field of each reading vs every field up front."""
+    from datetime import date
+    import numpy as np
+    from . import batch
+    from .columns import ReadingColumns
+    from .dates import date_range, days_in_month
+    from .readings import DateReading
+
+    dates = [(m, d, y) for y in range(2000, 2010)
+             for m in range(1, 13) for d in range(1, days_in_month(y, m) + 1)]
+    start, end = date(1, 1, 1), date(9999, 12, 31)
+    cases = [
+        ("synthesis only (3,653 dates)",
+         lambda: [_eager_reading(m, d, y).synthesis for m, d, y in dates],
+         lambda: [DateReading.of(m, d, y).synthesis for m, d, y in dates]),
+        ("one column (0001-9999)",
+         lambda: ReadingColumns.from_batch(batch.lookup(*date_range(start, end)[:3])).katan,
+         lambda: ReadingColumns.for_range(start, end).katan),
+    ]
+    rows = []
+    for label, before, after in cases:
+        assert np.array_equal(before(), after()), label
+        rows.append((label, _best_of(before, repeat=3), _best_of(after, repeat=3)))
+    _report("LAZY READINGS  ·  only the fields a caller reads", rows)
+
+
+# =============================================================================
+# METHOD AGREEMENT
+# =============================================================================
+
+def bench_agreement():
+    """Agreement matrix, combination counts and consensus over 1900-2099."""
+    from collections import Counter
+    from datetime import date
+    import numpy as np
+    from .agreement import AGREEMENT_METHODS, Agreement
+    from .methods import method_consensus
+    from .table import lookup
+
+    start, end = date(1900, 1, 1), date(2099, 12, 31)
+    n = len(AGREEMENT_METHODS)
+
+    def before():
+        agree = np.zeros((n, n))
+        combinations = Counter()
+        strengths = Counter()
+        for ordinal in range(start.toordinal(), end.toordinal() + 1):
+            d = date.fromordinal(ordinal)
+            e = lookup(d.month, d.day, d.year)
+            finals = tuple(e.final(m) for m in AGREEMENT_METHODS)
+            for i in range(n):
+                for j in range(n):
+                    agree[i, j] += finals[i] == finals[j]
+            combinations[finals] += 1
+            strengths[method_consensus(*finals)[1]] += 1
+        return agree / sum(combinations.values()), combinations, strengths
+
+    def after():
+        a = Agreement.for_range(start, end)
+        combinations = Counter({c.finals: c.days for c in a.combinations()})
+        strengths = Counter(dict(enumerate(np.bincount(a.consensus()[1]).tolist())))
+        return a.matrix(), combinations, +strengths
+
+    (m1, c1, s1), (m2, c2, s2) = before(), after()
+    assert np.allclose(m1, m2) and c1 == c2 and s1 == s2
+    _report("METHOD AGREEMENT  ·  matrix, combinations and consensus",
+            [("1900-2099 (73,049 dates)", _best_of(before, repeat=3), _best_of(after))])
+
+
+# =============================================================================
+# DAY REPORTS
+# =============================================================================
+
+def bench_report():
+    """A full year of calculate_day output, with and without the section cache."""
+    import io
+    from contextlib import redirect_stdout
+    from .days import iter_days
+    from .report import calculate_day, render_section
+
+    days = list(iter_days((2026, 1, 1), (2026, 12, 31)))
+
+    def run(cached):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            for d in days:
+                if not cached:
+                    render_section.cache_clear()   # every block rendered afresh
+                calculate_day(d.month, d.day, d.year, reading=d.reading())
+        return buf.getvalue()
+
+    assert run(False) == run(True)
+    _report("DAY REPORTS  ·  calculate_day for every day of 2026",
+            [("section cache", _best_of(lambda: run(False), repeat=3),
+              _best_of(lambda: run(True), repeat=3))])
+
+
+class _RegexTee:
+    """The year calculator's former stdout wrapper: colour on, regex-stripped copy."""
+
+    _ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+    def __init__(self, terminal, buffer):
+        self._terminal = terminal
+        self._buffer = buffer
+
+    def write(self, data):
+        self._terminal.write(data)
+        self._buffer.write(self._ANSI_RE.sub("", data))
+
+    def flush(self):
+        pass
+
+
+def bench_render():
+    """A full year to the terminal and the plain file: regex tee vs two renders."""
+    import io
+    from contextlib import redirect_stdout
+    from .days import iter_days
+    from .report import DayReport, calculate_day
+
+    days = list(iter_days((2026, 1, 1), (2026, 12, 31)))
+
+    def before():
+        terminal, plain = io.StringIO(), io.StringIO()
+        with redirect_stdout(_RegexTee(terminal, plain)):
+            for d in days:
+                calculate_day(d.month, d.day, d.year, reading=d.reading())
+        return terminal.getvalue(), plain.getvalue()
+
+    def after():
+        terminal, plain = [], []
+        for d in days:
+            coloured, text = DayReport.of(d.month, d.day, d.year, reading=d.reading()).render_both()
+            terminal.append(coloured)
+            plain.append(text)
+        return "".join(terminal), "".join(plain)
+
+    assert before() == after()
+    _report("PLAIN AND ANSI OUTPUT  ·  a year to terminal and file",
+            [("2026 (365 days)", _best_of(before, repeat=3), _best_of(after, repeat=3))])
+
+
+def bench_compact():
+    """A cold year-calculator run, full day reports vs --compact rows."""
+    import os
+    import subprocess
+    import sys
+    import tempfile
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = os.path.join(package_dir, "year-calculator.py")
+    with tempfile.TemporaryDirectory() as home:
+        # A new process per run, so every lookup and cached block starts cold
+        def run(*flags):
+            return subprocess.run([sys.executable, script, *flags], input="2026\n",
+                                  env=dict(os.environ, HOME=home), check=True,
+                                  capture_output=True, text=True).stdout
+
+        lines = [run().count("\n"), run("--compact").count("\n")]
+        rows = [(f"{lines[0]:,} vs {lines[1]:,} lines", _best_of(run, repeat=3),
+                 _best_of(lambda: run("--compact"), repeat=3))]
+    _report("COMPACT CALENDAR  ·  year-calculator 2026, new process per run", rows)
+
+
+# =============================================================================
+# PACKED ALMANAC
+# =============================================================================
+
+def bench_almanac():
+    """First answer in a fresh process: the mapped almanac vs a table lookup."""
+    import os
+    import subprocess
+    import sys
+    import tempfile
+    from .almanac import build_almanac
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_almanac(os.path.join(tmp, "almanac.bin"))
+        table = ("from numerology.table import lookup; "
+                 "print(lookup(2, 28, 2026).final('synthesis'))")
+        almanac = ("from datetime import date; from numerology.almanac import Almanac; "
+                   f"print(Almanac({path!r}).final('synthesis', date(2026, 2, 28)))")
+
+        def run(code):
+            return subprocess.run([sys.executable, "-c", code], cwd=package_dir, check=True,
+                                  capture_output=True, text=True).stdout
+
+        assert run(table) == run(almanac)
+        rows = [("synthesis of one date", _best_of(lambda: run(table), repeat=5),
+                 _best_of(lambda: run(almanac), repeat=5))]
+    _report("PACKED ALMANAC  ·  new process per case, interpreter start included", rows)
+
+
+# =============================================================================
+# THREADS
+# =============================================================================
+
+def _evaluate_dates(dates):
+    """Every scalar method over a list of (month, day, year); a checksum of finals."""
+    from .methods import (
+        method_boneeh, method_full_component, method_hebrew_standard,
+        method_katan, method_pythagorean, method_synthesis,
+    )
+    total = 0
+    for m, d, y in dates:
+        greek = method_pythagorean(m, d, y)[4]
+        hebrew = method_hebrew_standard(m, d, y)[4]
+        total += (greek + hebrew + method_katan(m, d, y)[2]
+                  + method_full_component(m, d, y)[4] + method_boneeh(m, d, y)[4]
+                  + method_synthesis(greek, hebrew))
+    return total
+
+
+def bench_threads():
+    """One large date batch split across 1, 2, 4 and 8 threads."""
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import date, timedelta
+
+    start, end = date(1900, 1, 1), date(2099, 12, 31)
+    dates = [(d.month, d.day, d.year)
+             for d in (start + timedelta(n) for n in range((end - start).days + 1))]
+    expected = _evaluate_dates(dates)
+
+    rows = []
+    for threads in (1, 2, 4, 8):
+        chunks = [dates[i::threads] for i in range(threads)]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            def run():
+                assert sum(pool.map(_evaluate_dates, chunks)) == expected
+            rows.append((threads, _best_of(run, repeat=3)))
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print()
+    print(f"  THREADS  ·  {len(dates):,} dates, every method  ·  "
+          f"GIL {'enabled' if gil else 'disabled'}")
+    print("  " + "─" * 68)
+    print(f"  {'THREADS':<30}  {'TIME':>10}  {'DATES/S':>10}  {'SCALING':>10}")
+    print("  " + "─" * 68)
+    single = rows[0][1]
+    for threads, elapsed in rows:
+        print(f"  {threads:<30}  {elapsed * 1e3:>8.2f}ms  {len(dates) / elapsed:>10,.0f}  "
+              f"{single / elapsed:>9.2f}x")
+    print("  " + "─" * 68)
+
+
+BENCHMARKS = {
+    "reduction": bench_reduction,
+    "huge":      bench_huge,
+    "bitmaps":   bench_bitmaps,
+    "days":      bench_days,
+    "dates":     bench_dates,
+    "readings":  bench_readings,
+    "agreement": bench_agreement,
+    "report":    bench_report,
+    "render":    bench_render,
+    "compact":   bench_compact,
+    "almanac":   bench_almanac,
+    "threads":   bench_threads,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python3 -m numerology.benchmarks",
+        description="Benchmark the numerology engine against the code it replaced.",
+    )
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} "
+                             f"(default: all)")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+    print()
+
+
+if __name__ == "__main__":
+    main()
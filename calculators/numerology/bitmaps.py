@@ -0,0 +1,270 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# BITMAP INDEXES  (requires NumPy)
+# Compound searches such as "Greek 9 AND Katan sacred AND Bone'eh 9 in
+# 2025-2035" as bitwise operations over precomputed sets of day ordinals,
+# instead of re-running every method on every date for every query:
+#
+#   index = DateBitmapIndex(date(2025, 1, 1), date(2035, 12, 31))
+#   hits = (index.bitmap("pythagorean", 9) & index.sacred("katan")
+#           & index.bitmap("boneeh", 9))
+#   len(hits), list(hits.dates())
+#
+# A Bitmap splits the ordinals (date.toordinal()) into chunks of 65,536
+# days.  A chunk holding up to 4,096 days is a sorted uint16 array of their
+# low bits; a denser chunk is a fixed 8 KB bitset of 1,024 uint64 words.
+# AND, OR and difference work chunk by chunk on whichever forms meet.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from datetime import date
+
+import numpy as np
+
+from .columns import ReadingColumns
+from .sacred import SACRED_METHODS
+from .table import METHODS
+
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+ARRAY_MAX = 4096                     # beyond this a bitset is smaller
+
+
+# =============================================================================
+# CONTAINERS
+# =============================================================================
+
+def _is_bitset(c):
+    return c.dtype == np.uint64
+
+
+def _to_bitset(lows):
+    bits = np.zeros(1 << CHUNK_BITS, dtype=bool)
+    bits[lows] = True
+    return np.packbits(bits, bitorder="little").view(np.uint64)
+
+
+def _to_array(words):
+    return np.flatnonzero(
+        np.unpackbits(words.view(np.uint8), bitorder="little")).astype(np.uint16)
+
+
+def _popcount(words):
+    if hasattr(np, "bitwise_count"):          # NumPy 2.0+
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+def _cardinality(c):
+    return _popcount(c) if _is_bitset(c) else len(c)
+
+
+def _container(lows):
+    """The smaller form for a sorted uint16 array of low bits, or None if empty."""
+    if len(lows) == 0:
+        return None
+    return _to_bitset(lows) if len(lows) > ARRAY_MAX else lows
+
+
+def _shrink(words):
+    """A bitset result back in its smaller form, or None if empty."""
+    n = _cardinality(words)
+    if n == 0:
+        return None
+    return _to_array(words) if n <= ARRAY_MAX else words
+
+
+def _contains(words, lows):
+    """Boolean mask: which of lows are set in the bitset."""
+    lows = lows.astype(np.uint64)
+    return (words[lows >> np.uint64(6)] >> (lows & np.uint64(63))) & np.uint64(1) == 1
+
+
+def _and(a, b):
+    if _is_bitset(a) and _is_bitset(b):
+        return _shrink(a & b)
+    if _is_bitset(a):
+        a, b = b, a
+    if _is_bitset(b):
+        return _container(a[_contains(b, a)])
+    return _container(np.intersect1d(a, b, assume_unique=True))
+
+
+def _or(a, b):
+    if not _is_bitset(a) and not _is_bitset(b):
+        return _container(np.union1d(a, b))
+    if not _is_bitset(a):
+        a = _to_bitset(a)
+    if not _is_bitset(b):
+        b = _to_bitset(b)
+    return a | b
+
+
+def _sub(a, b):
+    if _is_bitset(a):
+        if not _is_bitset(b):
+            b = _to_bitset(b)
+        return _shrink(a & ~b)
+    if _is_bitset(b):
+        return _container(a[~_contains(b, a)])
+    return _container(np.setdiff1d(a, b, assume_unique=True))
+
+
+# =============================================================================
+# BITMAP
+# =============================================================================
+
+class Bitmap:
+    """A compressed, immutable set of day ordinals."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks=None):
+        self._chunks = chunks or {}      # chunk key -> non-empty container
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """Bitmap of any iterable or array of day ordinals."""
+        ordinals = np.sort(np.asarray(ordinals, dtype=np.int64))
+        if len(ordinals):
+            ordinals = ordinals[np.concatenate(([True], ordinals[1:] != ordinals[:-1]))]
+        chunks = {}
+        bounds = np.flatnonzero(np.diff(ordinals >> CHUNK_BITS)) + 1
+        for part in np.split(ordinals, bounds):
+            if len(part):
+                chunks[int(part[0]) >> CHUNK_BITS] = _container(
+                    (part & CHUNK_MASK).astype(np.uint16))
+        return cls(chunks)
+
+    @classmethod
+    def from_dates(cls, start, end):
+        """Bitmap of every date from start to end (datetime.date), inclusive."""
+        return cls.from_ordinals(np.arange(start.toordinal(), end.toordinal() + 1))
+
+    def _combine(self, other, op, keys):
+        chunks = {}
+        for key in keys:
+            a, b = self._chunks.get(key), other._chunks.get(key)
+            if b is None:
+                c = a
+            elif a is None:
+                c = b
+            else:
+                c = op(a, b)
+            if c is not None:
+                chunks[key] = c
+        return Bitmap(chunks)
+
+    def __and__(self, other):
+        return self._combine(other, _and, self._chunks.keys() & other._chunks.keys())
+
+    def __or__(self, other):
+        return self._combine(other, _or, self._chunks.keys() | other._chunks.keys())
+
+    def __sub__(self, other):
+        return self._combine(other, _sub, self._chunks.keys())
+
+    def __len__(self):
+        return sum(_cardinality(c) for c in self._chunks.values())
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    def __contains__(self, day):
+        ordinal = day.toordinal() if isinstance(day, date) else day
+        c = self._chunks.get(ordinal >> CHUNK_BITS)
+        if c is None:
+            return False
+        low = np.array([ordinal & CHUNK_MASK], dtype=np.uint16)
+        if _is_bitset(c):
+            return bool(_contains(c, low)[0])
+        i = np.searchsorted(c, low[0])
+        return i < len(c) and c[i] == low[0]
+
+    def ordinals(self):
+        """Every ordinal in the set, as one sorted int64 array."""
+        parts = [(key << CHUNK_BITS) + (_to_array(c) if _is_bitset(c) else c).astype(np.int64)
+                 for key, c in sorted(self._chunks.items())]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def __iter__(self):
+        for key, c in sorted(self._chunks.items()):
+            base = key << CHUNK_BITS
+            for low in (_to_array(c) if _is_bitset(c) else c).tolist():
+                yield base + low
+
+    def dates(self):
+        """Lazily yield every date in the set, in order."""
+        for ordinal in self:
+            yield date.fromordinal(ordinal)
+
+    @property
+    def nbytes(self):
+        return sum(c.nbytes for c in self._chunks.values())
+
+    def __eq__(self, other):
+        if not isinstance(other, Bitmap):
+            return NotImplemented
+        return (self._chunks.keys() == other._chunks.keys()
+                and all(np.array_equal(c, other._chunks[k]) for k, c in self._chunks.items()))
+
+    def __repr__(self):
+        return f"<Bitmap: {len(self)} days, {self.nbytes / 1e3:.1f} KB>"
+
+
+# =============================================================================
+# DATE INDEX
+# =============================================================================
+
+class DateBitmapIndex:
+    """One Bitmap per (method, final value) over every date in a span."""
+
+    def __init__(self, start=date(1, 1, 1), end=date(9999, 12, 31)):
+        self.start, self.end = start, end
+        cols = ReadingColumns.for_range(start, end)
+        first = start.toordinal()
+        self._bitmaps = {}
+        self._sacred = {}
+        for method in METHODS:
+            values = getattr(cols, method)
+            order = np.argsort(values, kind="stable")
+            bounds = np.flatnonzero(np.diff(values[order])) + 1
+            for part in np.split(order, bounds):
+                if len(part):
+                    self._bitmaps[(method, int(values[part[0]]))] = \
+                        Bitmap.from_ordinals(part + first)
+
+    def values(self, method):
+        """The final values `method` reaches somewhere in the span, ascending."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+        return sorted(v for m, v in self._bitmaps if m == method)
+
+    def bitmap(self, method, value):
+        """Dates in the span whose `method` result equals `value`."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+        return self._bitmaps.get((method, value), Bitmap())
+
+    def sacred(self, method):
+        """Dates in the span where `method` preserves any sacred sum."""
+        if method not in SACRED_METHODS:
+            raise ValueError(f"{method} preserves no sacred sums. Use one of "
+                             f"{', '.join(SACRED_METHODS)}.")
+        if method not in self._sacred:
+            result = Bitmap()
+            for value in sorted(SACRED_METHODS[method]):
+                result |= self.bitmap(method, value)
+            self._sacred[method] = result
+        return self._sacred[method]
+
+    def between(self, start, end):
+        """Every date from start to end (inclusive), to narrow a query."""
+        return Bitmap.from_dates(max(start, self.start), min(end, self.end))
+
+    @property
+    def nbytes(self):
+        return sum(b.nbytes for b in self._bitmaps.values())
+
+    def __repr__(self):
+        return (f"<DateBitmapIndex: {self.start} to {self.end}, "
+                f"{len(self._bitmaps)} bitmaps, {self.nbytes / 1e6:.1f} MB>")
@@ -0,0 +1,121 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# CALENDAR ARITHMETIC
+# Leap years and month lengths in the proleptic Gregorian calendar used by
+# the calculators, without going through the calendar module.
+#
+# Day ordinals follow date.toordinal() (1 January 0001 is day 1) but work
+# for any year.  civil_from_days turns ordinals back into dates with plain
+# integer arithmetic -- 400-year eras, then years within an era counted
+# from 1 March so the leap day falls last -- which runs unchanged on whole
+# NumPy arrays: date_range produces every date of a span in one pass.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year, month):
+    if month == 2 and is_leap(year):
+        return 29
+    return _MONTH_DAYS[month]
+
+
+def days_in_year(year):
+    return 366 if is_leap(year) else 365
+
+
+# =============================================================================
+# DAY ORDINALS
+# =============================================================================
+
+_DAYS_PER_ERA = 146097          # days in 400 Gregorian years
+_MARCH_EPOCH = 305              # ordinal 1 is day 306 of the year from 1 March 0000
+
+
+def days_from_civil(year, month, day):
+    """The day ordinal of a date (1 January 0001 is day 1), for any year."""
+    y = year - (month <= 2)
+    era = y // 400
+    year_of_era = y - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * _DAYS_PER_ERA + day_of_era - _MARCH_EPOCH
+
+
+def civil_from_days(ordinal):
+    """
+    (year, month, day) of a day ordinal.  Pure integer arithmetic, so
+    ordinal may also be a NumPy integer array; the result is then three
+    arrays.
+    """
+    z = ordinal + _MARCH_EPOCH
+    era = z // _DAYS_PER_ERA
+    day_of_era = z - era * _DAYS_PER_ERA
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524
+                   - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    mp = (5 * day_of_year + 2) // 153               # month counted from March = 0
+    day = day_of_year - (153 * mp + 2) // 5 + 1
+    month = (mp + 2) % 12 + 1
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def weekday(ordinal):
+    """Monday = 0 ... Sunday = 6, as date.weekday(); arrays work too."""
+    return (ordinal - 1) % 7
+
+
+def _ymd(d):
+    """
+    (year, month, day) of a datetime.date or a (year, month, day) tuple,
+    checking that a tuple names a real date.
+    """
+    if not isinstance(d, tuple):
+        return d.year, d.month, d.day
+    year, month, day = d
+    if year < 1:
+        raise ValueError("Year must be 1 or later.")
+    if not 1 <= month <= 12:
+        raise ValueError("Month must be 1-12.")
+    if not 1 <= day <= days_in_month(year, month):
+        raise ValueError(f"Day must be 1-{days_in_month(year, month)} for {month:02d}-{year:04d}.")
+    return year, month, day
+
+
+def _ordinal(d):
+    """Day ordinal of a datetime.date or a (year, month, day) tuple."""
+    if isinstance(d, tuple):
+        return days_from_civil(*_ymd(d))
+    return d.toordinal()
+
+
+class DateRange(namedtuple("DateRange", "month day year weekday ordinal")):
+    """Parallel integer arrays describing every date of a span."""
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.ordinal)
+
+
+def date_range(start, end):
+    """
+    month, day, year, weekday and ordinal arrays for every date from start
+    to end inclusive, computed in one vectorized pass (requires NumPy).
+    start and end are datetime.date, or (year, month, day) tuples for years
+    past 9999; a tuple that is not a real date raises ValueError.  The
+    arrays are int32 while the ordinals fit, else int64.
+    """
+    import numpy as np
+
+    first, last = _ordinal(start), _ordinal(end)
+    dtype = np.int32 if last + _MARCH_EPOCH <= np.iinfo(np.int32).max else np.int64
+    ordinal = np.arange(first, last + 1, dtype=dtype)
+    year, month, day = civil_from_days(ordinal)
+    return DateRange(month, day, year, weekday(ordinal), ordinal)
@@ -0,0 +1,93 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DAY STREAMS
+# Consecutive days of a date range, walked forward with the digit sums of
+# month, day and year carried along instead of recomputed:
+#
+#   for d in iter_days(date(2026, 1, 1), date(2026, 12, 31)):
+#       d.month, d.day, d.year, d.year_ds
+#   for r in iter_readings(date(2026, 1, 1), date(2026, 12, 31)):
+#       r.katan, r.synthesis, ...
+#
+# Each step moves the day on by one.  A digit sum steps by +1, less 9 for
+# every trailing nine, so the day, month and year sums are updated only
+# when that component changes, and the year is never summed again.  Every
+# method depends on the year only through its digit sum, so a day's
+# reading is then a single table index: constant work per day, whatever
+# the size of the year.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+
+from .dates import _ymd, days_in_month
+from .readings import DateReading
+from .reduction import digit_sum
+from .table import lookup_ds
+
+
+class Day(namedtuple("Day", "month day year month_ds day_ds year_ds")):
+    """One day of a stream, with the digit sum of each component."""
+
+    __slots__ = ()
+
+    def entry(self):
+        """The day's TableEntry, indexed by its carried year digit sum."""
+        return lookup_ds(self.month, self.day, self.year_ds)
+
+    def reading(self):
+        """The day's DateReading."""
+        return DateReading.from_entry(self.month, self.day, self.year, self.entry())
+
+
+def next_digit_sum(n, ds):
+    """Digit sum of n + 1, given the digit sum ds of n."""
+    while n % 10 == 9:
+        n //= 10
+        ds -= 9
+    return ds + 1
+
+
+def _walk(start, end):
+    """
+    (month, day, year, month_ds, day_ds, year_ds) for every date, start to
+    end, both (year, month, day) tuples already checked by _ymd.
+    """
+    year, month, day = start
+    last_year, last_month, last_day = end
+    if (year, month, day) > (last_year, last_month, last_day):
+        return
+    year_ds, month_ds, day_ds = digit_sum(year), digit_sum(month), digit_sum(day)
+    length = days_in_month(year, month)
+    final_year = year == last_year
+    while True:
+        yield month, day, year, month_ds, day_ds, year_ds
+        if final_year and month == last_month and day == last_day:
+            return
+        if day < length:
+            day_ds = next_digit_sum(day, day_ds)
+            day += 1
+            continue
+        day, day_ds = 1, 1
+        if month < 12:
+            month_ds = next_digit_sum(month, month_ds)
+            month += 1
+        else:
+            month, month_ds = 1, 1
+            year_ds = next_digit_sum(year, year_ds)
+            year += 1
+            final_year = year == last_year
+        length = days_in_month(year, month)
+
+
+def iter_days(start, end):
+    """
+    An iterator of Day records for every date from start to end, inclusive.
+    start and end are datetime.date, or (year, month, day) tuples for years
+    past 9999; a tuple that is not a real date raises ValueError.
+    """
+    return map(Day._make, _walk(_ymd(start), _ymd(end)))
+
+
+def iter_readings(start, end):
+    """An iterator of the DateReading of every date from start to end, inclusive."""
+    return (DateReading.from_entry(month, day, year, lookup_ds(month, day, year_ds))
+            for month, day, year, _, _, year_ds in _walk(_ymd(start), _ymd(end)))
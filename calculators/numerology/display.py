@@ -0,0 +1,64 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DISPLAY HELPERS
+# Text wrapping, ANSI colour and section banners shared by every calculator.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+
+
+def wrap(text, width=72, indent="  "):
+    words = text.split()
+    lines = []
+    cur = indent
+    for w in words:
+        if len(cur) + len(w) + 1 > width:
+            lines.append(cur.rstrip())
+            cur = indent + w + " "
+        else:
+            cur += w + " "
+    if cur.strip():
+        lines.append(cur.rstrip())
+    return "\n".join(lines)
+
+
+def bold(t):   return f"\033[1m{t}\033[0m"
+def dim(t):    return f"\033[90m{t}\033[0m"
+def cyan(t):   return f"\033[36m{t}\033[0m"
+def amber(t):  return f"\033[33m{t}\033[0m"
+def green(t):  return f"\033[32m{t}\033[0m"
+def blue(t):   return f"\033[34m{t}\033[0m"
+def magenta(t):return f"\033[35m{t}\033[0m"
+def plain(t):  return f"{t}"
+
+
+class Palette(namedtuple("Palette", "bold dim cyan amber green blue magenta")):
+    """The colour helpers of one colour mode."""
+
+    __slots__ = ()
+
+
+ANSI = Palette(bold, dim, cyan, amber, green, blue, magenta)
+PLAIN = Palette(*(plain,) * len(Palette._fields))
+
+
+def palette(colour):
+    """ANSI for colour=True, PLAIN for plain text."""
+    return ANSI if colour else PLAIN
+
+
+def header(title, width=72):
+    print(); print("=" * width)
+    print(f"  {title}"); print("=" * width)
+
+
+def render_subheader(title, color_fn=None, width=72):
+    """A subheader banner as text, starting with its blank line."""
+    line = "-" * width
+    label = f"  {title}"
+    if color_fn:
+        line, label = color_fn(line), color_fn(label)
+    return "\n".join(("", line, label, line))
+
+
+def subheader(title, color_fn=None, width=72):
+    print(render_subheader(title, color_fn, width))
@@ -0,0 +1,172 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# OUTCOME DISTRIBUTIONS
+# Exact histograms of each method's final value over any span of years,
+# without visiting the days:
+#
+#   distribution("katan", 1900, 1999)       # Counter({3: 4059, 6: 4059, ...})
+#   distributions(1, 9999)                  # every method at once
+#
+# A date's reading depends only on (month, day) and the year's digit sum,
+# and which (month, day) pairs exist depends only on whether the year is a
+# leap year.  So the histogram over a span is the convolution of
+#
+#   * how many years in the span have each (digit sum, leap) class, counted
+#     by a digit DP over the centuries, in time that grows with the number of
+#     digits of the span, not its length; and
+#   * the fixed month/day histogram of each (digit sum, leap) class, taken
+#     from the result table.
+#
+# Pass cross_check=True to also enumerate every day and compare.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+
+from .dates import days_in_month, is_leap
+from .days import iter_days
+from .methods import HEBREW_SACRED_EXTENDED
+from .reduction import decimal_digits
+from .table import METHODS, lookup_ds, year_digit_sum
+
+
+# =============================================================================
+# YEAR CLASSES
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _free_digits(k):
+    """Counter of (digit sum, value mod 4) over every k-digit string 0..10^k-1."""
+    if k == 0:
+        return MappingProxyType(Counter({(0, 0): 1}))
+    # Prepend one more digit, worth 10^(k-1), to every (k-1)-digit string
+    weight = pow(10, k - 1, 4)
+    counts = Counter()
+    for (ds, r), c in _free_digits(k - 1).items():
+        for digit in range(10):
+            counts[(ds + digit, (r + digit * weight) % 4)] += c
+    return MappingProxyType(counts)
+
+
+def _count_upto(n):
+    """Counter of (digit sum, x mod 4) over integers 0 <= x <= n."""
+    counts = Counter()
+    if n < 0:
+        return counts
+    digits = decimal_digits(n)
+    k = len(digits)
+    prefix_ds, prefix_mod = 0, 0
+    for i, top in enumerate(digits):
+        rest = k - i - 1
+        place = pow(10, rest, 4)
+        for digit in range(top):
+            base_ds = prefix_ds + digit
+            base_mod = (prefix_mod + digit) * place % 4
+            for (ds, r), c in _free_digits(rest).items():
+                counts[(base_ds + ds, (base_mod + r) % 4)] += c
+        prefix_ds += top
+        prefix_mod = (prefix_mod + top) * 10 % 4
+    counts[(prefix_ds, n % 4)] += 1
+    return counts
+
+
+@lru_cache(maxsize=None)
+def _low_classes(century_mod4):
+    """Counter of (digit sum, leap) over the hundred years of one century."""
+    counts = Counter()
+    for low in range(100):
+        leap = low % 4 == 0 and (low != 0 or century_mod4 == 0)
+        counts[(year_digit_sum(low), leap)] += 1
+    return MappingProxyType(counts)
+
+
+def year_classes(first_year, last_year):
+    """Counter of (year digit sum, is leap) over years first_year..last_year."""
+    counts = Counter()
+    if first_year > last_year:
+        return counts
+    first_century, last_century = first_year // 100, last_year // 100
+    if first_century == last_century:
+        edges = range(first_year, last_year + 1)
+    else:
+        edges = list(range(first_year, (first_century + 1) * 100))
+        edges += range(last_century * 100, last_year + 1)
+        # Whole centuries between the edges: classify the century number
+        # by (digit sum, mod 4), then spread each over its hundred years.
+        centuries = _count_upto(last_century - 1)
+        centuries.subtract(_count_upto(first_century))
+        for (c_ds, c_mod), n in centuries.items():
+            if n:
+                for (l_ds, leap), m in _low_classes(c_mod).items():
+                    counts[(c_ds + l_ds, leap)] += n * m
+    for year in edges:
+        counts[(year_digit_sum(year), is_leap(year))] += 1
+    return counts
+
+
+# =============================================================================
+# MONTH/DAY HISTOGRAMS
+# =============================================================================
+
+# From this year digit sum on, no raw sum can land on a sacred value, so
+# every method sees only the digit sum mod 9.
+_PERIODIC_FROM = max(HEBREW_SACRED_EXTENDED)
+
+
+def _day_histograms(ds, leap):
+    """For one (digit sum, leap) class: method -> Counter of final values."""
+    if ds > _PERIODIC_FROM:
+        ds = _PERIODIC_FROM + (ds - _PERIODIC_FROM) % 9
+    return _class_histograms(ds, leap)
+
+
+@lru_cache(maxsize=None)
+def _class_histograms(ds, leap):
+    year = 2000 if leap else 2001     # any year with the right month lengths
+    hists = {method: Counter() for method in METHODS}
+    for month in range(1, 13):
+        for day in range(1, days_in_month(year, month) + 1):
+            entry = lookup_ds(month, day, ds)
+            for method in METHODS:
+                hists[method][entry.final(method)] += 1
+    return MappingProxyType({method: MappingProxyType(h) for method, h in hists.items()})
+
+
+# =============================================================================
+# DISTRIBUTIONS
+# =============================================================================
+
+def distributions(first_year, last_year, cross_check=False):
+    """
+    Exact histogram of every method's final value over all dates in years
+    first_year..last_year: a dict of method -> Counter(value -> days).
+    """
+    result = {method: Counter() for method in METHODS}
+    for (ds, leap), years in year_classes(first_year, last_year).items():
+        if years:
+            for method, hist in _day_histograms(ds, leap).items():
+                for value, days in hist.items():
+                    result[method][value] += years * days
+    if cross_check:
+        enumerated = enumerate_distributions(first_year, last_year)
+        if enumerated != result:
+            raise RuntimeError(f"Analytical and enumerated distributions disagree "
+                               f"for {first_year}-{last_year}.")
+    return result
+
+
+def distribution(method, first_year, last_year, cross_check=False):
+    """Exact histogram of one method's final value over years first_year..last_year."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+    return distributions(first_year, last_year, cross_check)[method]
+
+
+def enumerate_distributions(first_year, last_year):
+    """The same histograms as distributions(), by visiting every date."""
+    result = {method: Counter() for method in METHODS}
+    for d in iter_days((first_year, 1, 1), (last_year, 12, 31)):
+        entry = d.entry()
+        for method in METHODS:
+            result[method][entry.final(method)] += 1
+    return result
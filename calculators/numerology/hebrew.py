@@ -0,0 +1,177 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# HEBREW CALENDAR
+# Gregorian dates converted to the Hebrew calendar with the standard
+# arithmetic (molad of Tishri, the four postponement rules and the 19-year
+# leap cycle), computed locally, so the gematria methods can read a date
+# as Hebrew day, month and year:
+#
+#   to_hebrew(date(2026, 2, 28))       # HebrewDate(year=5786, month=12, day=11)
+#   calculate_day(2, 28, 2026, hebrew=True)
+#
+# Months are numbered from Nisan (1) as in the Torah; Tishri, which opens
+# the year, is 7, and a leap year's extra month Adar II is 13.
+#
+# The layout of a Hebrew year (its new-year day and month lengths) is
+# computed once and cached, as is the conversion of a whole Gregorian
+# year, so a year run costs one walk over 365 days instead of 365
+# independent conversions.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+from .dates import days_in_year as _gregorian_days
+
+
+# 1 Tishri AM 1 (7 October 3761 BCE, Julian) on the date.toordinal() scale
+HEBREW_EPOCH = -1373427
+
+NISAN, ADAR, ADAR_II, TISHRI = 1, 12, 13, 7
+
+_PARTS_PER_DAY = 25920       # 24 hours of 1080 parts
+_MONTH_PARTS = 13753         # a lunar month beyond 29 days, in parts
+_MOLAD_TOHU = 12084          # parts into day 1 of the molad of Tishri AM 1
+
+MONTH_NAMES = MappingProxyType({
+    1: "Nisan", 2: "Iyyar", 3: "Sivan", 4: "Tammuz", 5: "Av", 6: "Elul",
+    7: "Tishri", 8: "Marheshvan", 9: "Kislev", 10: "Tevet", 11: "Shevat",
+    12: "Adar", 13: "Adar II",
+})
+
+
+class HebrewDate(namedtuple("HebrewDate", "year month day")):
+    """A day of the Hebrew calendar; month 1 is Nisan, 7 is Tishri."""
+
+    __slots__ = ()
+
+    @property
+    def month_name(self):
+        return month_name(self.year, self.month)
+
+    def __str__(self):
+        return f"{self.day} {self.month_name} {self.year}"
+
+
+# =============================================================================
+# YEAR ARITHMETIC
+# =============================================================================
+
+def is_leap(year):
+    """Years 3, 6, 8, 11, 14, 17 and 19 of each 19-year cycle have Adar II."""
+    return (7 * year + 1) % 19 < 7
+
+
+def months_in_year(year):
+    return 13 if is_leap(year) else 12
+
+
+def month_name(year, month):
+    if month == ADAR and is_leap(year):
+        return "Adar I"
+    return MONTH_NAMES[month]
+
+
+def _elapsed_days(year):
+    """Days from the epoch to the molad of Tishri, after the first postponements."""
+    months = (235 * year - 234) // 19
+    parts = _MOLAD_TOHU + _MONTH_PARTS * months
+    days = 29 * months + parts // _PARTS_PER_DAY
+    # Lo ADU Rosh: 1 Tishri never falls on Sunday, Wednesday or Friday
+    return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+
+def _new_year_delay(year):
+    """Extra postponement keeping every year 353-355 or 383-385 days long."""
+    previous, current, following = (_elapsed_days(y) for y in (year - 1, year, year + 1))
+    if following - current == 356:
+        return 2
+    if current - previous == 382:
+        return 1
+    return 0
+
+
+def new_year(year):
+    """Ordinal (date.toordinal()) of 1 Tishri of a Hebrew year."""
+    return HEBREW_EPOCH + _elapsed_days(year) + _new_year_delay(year)
+
+
+def days_in_year(year):
+    return new_year(year + 1) - new_year(year)
+
+
+def days_in_month(year, month):
+    length = days_in_year(year)
+    if month in (2, 4, 6, 10, ADAR_II):
+        return 29
+    if month == ADAR and not is_leap(year):
+        return 29
+    if month == 8 and length % 10 != 5:          # Marheshvan is long only in 355/385
+        return 29
+    if month == 9 and length % 10 == 3:          # Kislev is short only in 353/383
+        return 29
+    return 30
+
+
+@lru_cache(maxsize=None)
+def year_structure(year):
+    """
+    The months of a Hebrew year in calendar order, Tishri first: a tuple of
+    (month, ordinal of its first day, length).  Computed once per year.
+    """
+    months = []
+    start = new_year(year)
+    for month in (*range(TISHRI, months_in_year(year) + 1), *range(NISAN, TISHRI)):
+        length = days_in_month(year, month)
+        months.append((month, start, length))
+        start += length
+    return tuple(months)
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+@lru_cache(maxsize=64)
+def gregorian_year(year):
+    """
+    The Hebrew date of every day of a Gregorian year, 1 January first,
+    walked day by day through at most two cached Hebrew year structures.
+    """
+    # 1 January always falls between 1 Tishri of AM year + 3760 and the next
+    hyear = year + 3760
+    months = year_structure(hyear)
+    ordinal = date(year, 1, 1).toordinal()
+    i = max(k for k, (_, start, _) in enumerate(months) if start <= ordinal)
+    month, start, length = months[i]
+    day = ordinal - start + 1
+
+    out = []
+    for _ in range(_gregorian_days(year)):
+        out.append(HebrewDate(hyear, month, day))
+        day += 1
+        if day > length:
+            i += 1
+            if i == len(months):
+                hyear += 1
+                months, i = year_structure(hyear), 0
+            month, start, length = months[i]
+            day = 1
+    return tuple(out)
+
+
+def to_hebrew(gdate):
+    """The HebrewDate of a datetime.date."""
+    return gregorian_year(gdate.year)[gdate.toordinal() - date(gdate.year, 1, 1).toordinal()]
+
+
+def from_hebrew(year, month, day):
+    """The datetime.date of a Hebrew year, month (1 = Nisan) and day."""
+    if not 1 <= month <= months_in_year(year):
+        raise ValueError(f"Hebrew year {year} has no month {month}.")
+    if not 1 <= day <= days_in_month(year, month):
+        raise ValueError(f"{month_name(year, month)} {year} has no day {day}.")
+    for m, start, _ in year_structure(year):
+        if m == month:
+            return date.fromordinal(start + day - 1)
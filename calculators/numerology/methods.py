@@ -0,0 +1,207 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DATE NUMEROLOGY METHODS
+# Five distinct numerological methods applied to any date:
+#
+#   1. GREEK PYTHAGOREAN (Isopsephy tradition)
+#      Each component (month, day, year) reduced to 1-9 individually,
+#      then summed and reduced again.  Source: Numerology Wikipedia;
+#      Gematria Wikipedia -- Pythagorean / Isopsephy section.
+#
+#   2. HEBREW STANDARD  (Mispar Hechrachi)
+#      Same arithmetic as Method 1, but sacred sums (13, 18, 26, 36)
+#      are preserved before final reduction.
+#      Source: Gematria Wikipedia -- Standard encoding; MyJewishLearning.
+#
+#   3. MISPAR KATAN  (All-Digits / Small Value)
+#      Every individual digit of the full date string MMDDYYYY is summed
+#      directly -- no intermediate component reduction.  Sacred sums
+#      (13, 18, 26, 36, 40, 49, 50, 70) preserved before final reduction.
+#      Source: Gematria Wikipedia -- "Mispar katan calculates the value of
+#      each letter, but truncates all of the zeros."
+#
+#   4. FULL COMPONENT  (Mispar Gadol-inspired)
+#      Month and day are used at full unreduced face value; year is summed
+#      to its digit total but NOT pre-reduced.  Total then reduced.
+#      Sacred sums preserved.  This preserves the larger intermediate
+#      magnitudes that mispar gadol keeps for final letters.
+#      Source: Gematria Wikipedia -- "Mispar gadol counts the final forms
+#      of the Hebrew letters as a continuation of the numerical sequence."
+#
+#   5. BONE'EH  (Building / Cumulative Value)
+#      Treats the three date components as sequential "letters" and applies
+#      the bone'eh formula: each step adds the running total plus the new
+#      value.  For components m, d, y (each reduced to 1-9):
+#        Bone'eh = 3m + 2d + y  (then reduced).
+#      Source: Gematria Wikipedia -- "Mispar bone'eh is calculated by
+#      walking over each letter, adding the value of all previous letters
+#      and the current letter to the running total."
+#
+# Letter values from Mathers Table (The Kabbalah Unveiled, 1887);
+# Significant numbers from MyJewishLearning; Kabbalah from Britannica.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from itertools import accumulate
+
+from .reduction import (
+    decimal_digits, digit_sum, preserving_table, reduce_preserving,
+    digital_root as reduce_to_single_digit,
+)
+
+
+# =============================================================================
+# UTILITY
+# =============================================================================
+
+def parse_date(date_str):
+    """Accept MM-DD-YYYY or MM/DD/YYYY."""
+    sep = '-' if '-' in date_str else '/'
+    parts = date_str.split(sep)
+    if len(parts) != 3:
+        raise ValueError("Use MM-DD-YYYY or MM/DD/YYYY.")
+    m, d, y = int(parts[0]), int(parts[1]), int(parts[2])
+    if not (1 <= m <= 12):
+        raise ValueError("Month must be 1-12.")
+    if not (1 <= d <= 31):
+        raise ValueError("Day must be 1-31.")
+    if y < 1:
+        raise ValueError("Year must be positive.")
+    return m, d, y
+
+
+def date_digits(month, day, year):
+    """Every digit of the date written as MMDDYYYY, as a list of ints."""
+    # Zero-pad month and day to 2 digits, year to 4; any year size works
+    return decimal_digits(month, 2) + decimal_digits(day, 2) + decimal_digits(year, 4)
+
+
+# =============================================================================
+# FIVE CALCULATION METHODS
+# =============================================================================
+
+def method_pythagorean(month, day, year):
+    """
+    Method 1 — Greek Pythagorean / Isopsephy.
+    Reduce each component individually, sum, reduce.
+    Returns (r_month, r_day, r_year, raw_sum, final).
+    """
+    rm = reduce_to_single_digit(month)
+    rd = reduce_to_single_digit(day)
+    ry = reduce_to_single_digit(digit_sum(year))
+    raw = rm + rd + ry
+    return rm, rd, ry, raw, reduce_to_single_digit(raw)
+
+
+# Sacred sums reachable by the standard 3-component method (max raw = 27):
+# 36 is impossible (max = 27), so it is left to the extended set below.
+HEBREW_SACRED_STANDARD = frozenset({13, 18, 26})
+_STANDARD_TABLE = preserving_table(HEBREW_SACRED_STANDARD)
+
+
+def method_hebrew_standard(month, day, year):
+    """
+    Method 2 — Hebrew Standard (Mispar Hechrachi).
+    Same arithmetic as Method 1 but preserves documented sacred sums
+    13 (Echad / divine mercy), 18 (Chai / life), 26 (YHVH) before
+    any final reduction.
+    Returns (r_month, r_day, r_year, raw_sum, final).
+    """
+    rm = reduce_to_single_digit(month)
+    rd = reduce_to_single_digit(day)
+    ry = reduce_to_single_digit(digit_sum(year))
+    raw = rm + rd + ry
+    # Sacred sums map to themselves in the table (the value is preserved)
+    return rm, rd, ry, raw, reduce_preserving(raw, _STANDARD_TABLE)
+
+
+# Expanded sacred set for methods 3-4 (larger intermediate values possible):
+HEBREW_SACRED_EXTENDED = frozenset({13, 18, 26, 36, 40, 49, 50, 70})
+_EXTENDED_TABLE = preserving_table(HEBREW_SACRED_EXTENDED)
+
+
+def method_katan(month, day, year):
+    """
+    Method 3 — Mispar Katan (All-Digits Sum).
+    Concatenate date as MMDDYYYY, sum every digit, reduce.
+    Sacred sums from HEBREW_SACRED_EXTENDED preserved.
+    Returns (digits_used, raw_sum, final).
+    """
+    digits = date_digits(month, day, year)
+    raw = digit_sum(month) + digit_sum(day) + digit_sum(year)
+    return digits, raw, reduce_preserving(raw, _EXTENDED_TABLE)
+
+
+def method_full_component(month, day, year):
+    """
+    Method 4 — Full Component (Mispar Gadol-inspired).
+    Use month and day at full face value; sum year digits but do NOT
+    pre-reduce that total.  Preserve sacred sums.
+    Returns (month_val, day_val, year_digit_sum, raw_sum, final).
+    """
+    year_ds = digit_sum(year)
+    raw = month + day + year_ds
+    return month, day, year_ds, raw, reduce_preserving(raw, _EXTENDED_TABLE)
+
+
+def method_boneeh(month, day, year):
+    """
+    Method 5 — Bone'eh (Building / Cumulative Value).
+    Source (Gematria Wikipedia, p.5):
+      "adding the value of all previous letters and the value of the
+       current letter to the running total."
+    'All previous letters' means the sum of the ORIGINAL letter values
+    seen so far, NOT the accumulated bone'eh running total.
+
+    For three date 'letters' [m, d, y] (each reduced 1-9):
+      Step 1: prev_orig=0;   running += (0 + m)       → running = m
+      Step 2: prev_orig=m;   running += (m + d)        → running = 2m + d
+      Step 3: prev_orig=m+d; running += (m + d + y)    → running = 3m + 2d + y
+
+    Final value then reduced to single digit.
+    Returns (m, d, y, (step1, step2, step3), final).
+    """
+    m = reduce_to_single_digit(month)
+    d = reduce_to_single_digit(day)
+    y = reduce_to_single_digit(digit_sum(year))
+
+    step1, step2, step3 = boneeh_steps((m, d, y))
+    return m, d, y, (step1, step2, step3), reduce_to_single_digit(step3)
+
+
+def boneeh_steps(letters):
+    """
+    Bone'eh running totals for a sequence of any length (letter values,
+    digits, time components ...).  The running total after letter k adds
+    the sum of letters 1..k, so the totals are the prefix sums of the
+    prefix sums -- O(n), with no re-summing of the letters seen so far.
+    """
+    return list(accumulate(accumulate(letters)))
+
+
+def boneeh_value(letters):
+    """Final bone'eh value of a sequence: its last running total, reduced."""
+    steps = boneeh_steps(letters)
+    return reduce_to_single_digit(steps[-1]) if steps else 0
+
+
+def method_synthesis(greek_num, hebrew_std_num):
+    """
+    Combined synthesis -- Greek Pythagorean + Hebrew Standard.
+    The Hebrew value is reduced first (a preserved sacred sum counts by
+    its digit root), then the pair is summed and reduced.
+    Returns the single-digit synthesis number.
+    """
+    return reduce_to_single_digit(
+        greek_num + reduce_to_single_digit(hebrew_std_num)
+    )
+
+
+def method_consensus(*finals):
+    """
+    Consensus strength -- how many of the five methods agree on a date.
+    Takes each method's final value and returns (value, count): the value
+    reached by the most methods and how many reach it (1 when no two
+    agree).  Values agree only when equal, so a preserved sacred sum (18)
+    does not agree with its root (9).  Ties go to the smaller value.
+    """
+    count = max(map(finals.count, finals))
+    return min(v for v in finals if finals.count(v) == count), count
@@ -0,0 +1,152 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DATE QUERIES
+# "Which days between 1900 and 2100 have a Mispar Katan of 18?"
+#
+#   for d in find_dates("katan", 18, date(1900, 1, 1), date(2100, 12, 31)):
+#       ...
+#
+# A query never evaluates a day.  For each year digit sum the result table
+# already says which (month, day) pairs reach the target, so a year costs
+# one digit-sum lookup, and years with no candidates are skipped outright.
+# Pythagorean, Bone'eh and the synthesis only see the year's digit root,
+# which is the year mod 9, so for them the matching years repeat every nine
+# years.  Either way the candidate years for a (method, value) pair are
+# listed once, and every query binary-searches that list.  The first query
+# in a process pays for the candidates: read from the batch table, tens of
+# milliseconds once NumPy is loaded; without NumPy, every cell of the
+# scalar table is filled first, over a hundred milliseconds.
+#
+#   next_occurrence("synthesis", 7, date.today())
+#   previous_occurrence("hebrew_standard", 26, date.today())
+# ─────────────────────────────────────────────────────────────────────────────
+
+from bisect import bisect_left, bisect_right
+from datetime import MAXYEAR, date
+from functools import lru_cache
+
+from .dates import days_in_month
+from .table import MAX_DIGIT_SUM, METHODS, lookup, lookup_ds, year_digit_sum
+
+
+# Methods whose result depends on the year only through year mod 9
+PERIODIC_METHODS = frozenset({"pythagorean", "boneeh", "synthesis"})
+
+
+def _check_method(method):
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+
+
+@lru_cache(maxsize=None)
+def matches_by_digit_sum(method, value):
+    """
+    For each year digit sum 0-36, the (month, day) pairs whose `method`
+    result equals `value`, in calendar order.  Day 29-31 entries still
+    have to be checked against the actual month length.  Read from the
+    batch table when NumPy is available, else from every cell of the
+    scalar table.
+    """
+    _check_method(method)
+    try:
+        from .batch import _grid
+    except ImportError:
+        # Without NumPy every cell of the scalar table is filled instead
+        return tuple(
+            tuple((m, d) for m in range(1, 13) for d in range(1, 32)
+                  if lookup_ds(m, d, ds).final(method) == value)
+            for ds in range(MAX_DIGIT_SUM + 1)
+        )
+    hits = (_grid()[method] == value).transpose(2, 0, 1)     # (ds, month, day)
+    return tuple(
+        tuple((m + 1, d + 1) for m, d in zip(*(axis.tolist() for axis in hits[ds].nonzero())))
+        for ds in range(MAX_DIGIT_SUM + 1)
+    )
+
+
+@lru_cache(maxsize=None)
+def _residues(method, value):
+    """Year residues mod 9 that have any match, for a periodic method."""
+    table = matches_by_digit_sum(method, value)
+    return tuple(sorted({ds % 9 for ds in range(1, MAX_DIGIT_SUM + 1) if table[ds]}))
+
+
+def year_matches(method, value, year):
+    """The (month, day) pairs of `year` whose `method` result equals `value`."""
+    ds = year_digit_sum(year)
+    if ds <= MAX_DIGIT_SUM:
+        candidates = matches_by_digit_sum(method, value)[ds]
+    else:
+        candidates = tuple((m, d) for m in range(1, 13) for d in range(1, 32)
+                           if lookup(m, d, year).final(method) == value)
+    return [(m, d) for m, d in candidates if d <= days_in_month(year, m)]
+
+
+@lru_cache(maxsize=None)
+def candidate_years(method, value):
+    """
+    Sorted years 1-9999 that can hold a match.  For periodic methods this
+    is every year in the matching residues mod 9; for the others, every
+    year whose digit sum has candidates.  (A year whose only candidate is
+    29 February may still turn out empty.)
+    """
+    if method in PERIODIC_METHODS:
+        residues = _residues(method, value)
+        return tuple(y for y in range(1, MAXYEAR + 1) if y % 9 in residues)
+    table = matches_by_digit_sum(method, value)
+    return tuple(y for y in range(1, MAXYEAR + 1) if table[year_digit_sum(y)])
+
+
+def find_dates(method, value, start, end):
+    """
+    Lazily yield every date from start to end (datetime.date, inclusive)
+    whose `method` result equals `value`, in chronological order.
+    `method` is one of METHODS; sacred values (13, 18, 26, ...) match
+    only where the method preserves them.
+    """
+    _check_method(method)
+    return _find_dates(method, value, start, end)
+
+
+def _find_dates(method, value, start, end):
+    years = candidate_years(method, value)
+    for i in range(bisect_left(years, start.year), bisect_right(years, end.year)):
+        year = years[i]
+        for m, d in year_matches(method, value, year):
+            day = date(year, m, d)
+            if day < start:
+                continue
+            if day > end:
+                return
+            yield day
+
+
+def next_occurrence(method, value, after):
+    """
+    The first date strictly after `after` (datetime.date) whose `method`
+    result equals `value`, or None if there is none before year 10000.
+    """
+    _check_method(method)
+    years = candidate_years(method, value)
+    for i in range(bisect_left(years, after.year), len(years)):
+        year = years[i]
+        for m, d in year_matches(method, value, year):
+            day = date(year, m, d)
+            if day > after:
+                return day
+    return None
+
+
+def previous_occurrence(method, value, before):
+    """
+    The last date strictly before `before` (datetime.date) whose `method`
+    result equals `value`, or None if there is none from year 1 onwards.
+    """
+    _check_method(method)
+    years = candidate_years(method, value)
+    for i in range(bisect_right(years, before.year) - 1, -1, -1):
+        year = years[i]
+        for m, d in reversed(year_matches(method, value, year)):
+            day = date(year, m, d)
+            if day < before:
+                return day
+    return None
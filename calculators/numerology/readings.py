@@ -0,0 +1,135 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DATE READINGS
+# A compact, named record of every method's result for one date, in place
+# of the positional tuples returned by the method_* functions:
+#
+#   r = DateReading.of(2, 28, 2026)
+#   r.pythagorean, r.katan, r.full_component, r.boneeh_step3, r.synthesis
+#
+# The field names match numerology.batch.BATCH_DTYPE, so a row of a batch
+# and a DateReading carry the same values under the same names.
+#
+# A reading from DateReading.of() starts out holding just its date.  The
+# first field read of each method looks that method up and fills in its
+# fields, so a caller showing only the synthesis never unpacks the rest.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from .methods import date_digits, method_consensus
+from .table import lookup
+
+
+FIELDS = (
+    "month", "day", "year",
+    # Methods 1, 2 and 5 share the reduced components
+    "r_month", "r_day", "r_year",
+    # Methods 1 and 2 share the raw sum
+    "raw_sum", "pythagorean", "hebrew_standard",
+    "katan_raw", "katan",
+    "year_digit_sum", "full_raw", "full_component",
+    "boneeh_step1", "boneeh_step2", "boneeh_step3", "boneeh",
+    "synthesis",
+)
+
+
+# Each method's fields, filled from the date's TableEntry on first access
+def _fill_pythagorean(r, e):
+    r.r_month, r.r_day, r.r_year, r.raw_sum, r.pythagorean = e.pythagorean
+
+
+def _fill_hebrew_standard(r, e):
+    r.hebrew_standard = e.hebrew_standard[4]
+
+
+def _fill_katan(r, e):
+    r.katan_raw, r.katan = e.katan
+
+
+def _fill_full_component(r, e):
+    _, _, r.year_digit_sum, r.full_raw, r.full_component = e.full_component
+
+
+def _fill_boneeh(r, e):
+    _, _, _, (r.boneeh_step1, r.boneeh_step2, r.boneeh_step3), r.boneeh = e.boneeh
+
+
+def _fill_synthesis(r, e):
+    r.synthesis = e.synthesis
+
+
+_FILLS = {
+    "r_month": _fill_pythagorean, "r_day": _fill_pythagorean,
+    "r_year": _fill_pythagorean, "raw_sum": _fill_pythagorean,
+    "pythagorean": _fill_pythagorean,
+    "hebrew_standard": _fill_hebrew_standard,
+    "katan_raw": _fill_katan, "katan": _fill_katan,
+    "year_digit_sum": _fill_full_component, "full_raw": _fill_full_component,
+    "full_component": _fill_full_component,
+    "boneeh_step1": _fill_boneeh, "boneeh_step2": _fill_boneeh,
+    "boneeh_step3": _fill_boneeh, "boneeh": _fill_boneeh,
+    "synthesis": _fill_synthesis,
+}
+
+
+class DateReading:
+    """Every method's result for one date, one slot per field."""
+
+    __slots__ = FIELDS + ("katan_digits", "_entry")
+
+    def __init__(self, *values):
+        if len(values) != len(FIELDS):
+            raise TypeError(f"DateReading takes {len(FIELDS)} values, got {len(values)}.")
+        for name, value in zip(FIELDS, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def of(cls, month, day, year):
+        """Reading for one date; each method is looked up on first access."""
+        r = cls.__new__(cls)
+        r.month, r.day, r.year = month, day, year
+        return r
+
+    @classmethod
+    def from_entry(cls, month, day, year, e):
+        """Reading for one date whose TableEntry is already looked up."""
+        r = cls.of(month, day, year)
+        r._entry = e
+        return r
+
+    def __getattr__(self, name):
+        # Only reached for a slot not filled yet
+        if name == "_entry":
+            self._entry = lookup(self.month, self.day, self.year)
+            return self._entry
+        if name == "katan_digits":
+            # The MMDDYYYY digits summed by Mispar Katan
+            self.katan_digits = date_digits(self.month, self.day, self.year)
+            return self.katan_digits
+        fill = _FILLS.get(name)
+        if fill is None:
+            raise AttributeError(f"'DateReading' object has no attribute '{name}'")
+        fill(self, self._entry)
+        return object.__getattribute__(self, name)
+
+    @property
+    def boneeh_steps(self):
+        return self.boneeh_step1, self.boneeh_step2, self.boneeh_step3
+
+    @property
+    def consensus(self):
+        """(value, count): how many of the five methods agree, and on what."""
+        return method_consensus(self.pythagorean, self.hebrew_standard, self.katan,
+                                self.full_component, self.boneeh)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, DateReading):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in FIELDS)
+
+    def __repr__(self):
+        return (f"DateReading({self.month:02d}-{self.day:02d}-{self.year:04d}: "
+                f"greek={self.pythagorean} hebrew={self.hebrew_standard} "
+                f"katan={self.katan} gadol={self.full_component} "
+                f"boneeh={self.boneeh} synthesis={self.synthesis})")
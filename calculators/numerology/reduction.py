@@ -0,0 +1,196 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DIGIT REDUCTION
+# Every calculator reduces numbers by summing their digits.  Three flavours
+# are in use:
+#
+#   digital_root       plain 1-9 reduction (the date methods).  Closed form:
+#                      a positive n reduces to 1 + (n - 1) mod 9.
+#   reduce_master      stops early on the master numbers 11, 22 and 33
+#                      (birthdate calculator, master number name generator).
+#   reduce_preserving  keeps a chosen set of sacred sums unreduced and
+#                      otherwise falls back to the digital root (Hebrew
+#                      Standard, Mispar Katan, Full Component).
+#
+# Digit sums and the master / sacred variants are answered from lookup
+# tables, so no call round-trips through str().  The digit-sum table is
+# built at import; the chunk-digit and master tables on first use.
+# Huge integers (astronomical-scale years, far past the int -> str limit)
+# are split in halves by cached powers of ten, so their digits cost a few
+# large divisions instead of one full-length division per chunk.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from functools import lru_cache
+from itertools import product
+from threading import Lock
+
+
+# Numbers below this are answered by a single table lookup; larger ones are
+# split into base-10000 chunks first.
+TABLE_SIZE = 10000
+
+MASTER_NUMBERS = frozenset({11, 22, 33})
+
+# Numbers of at most 2 ** _SPLIT_LEVEL base-10000 chunks are read chunk by
+# chunk; longer ones are divided in halves first.
+_SPLIT_LEVEL = 5
+
+
+def _build_digit_sums(size):
+    sums = [0] * size
+    for n in range(1, size):
+        sums[n] = sums[n // 10] + n % 10
+    return sums
+
+
+_DIGIT_SUM = tuple(_build_digit_sums(TABLE_SIZE))
+
+
+@lru_cache(maxsize=None)
+def _chunk_digits():
+    """
+    (digits, lengths): the four decimal digits of every chunk, leading
+    zeros included, and how many of them are significant.
+    """
+    return (tuple(product(range(10), repeat=4)),
+            (1,) * 10 + (2,) * 90 + (3,) * 900 + (4,) * 9000)
+
+
+# =============================================================================
+# HUGE INTEGERS
+# =============================================================================
+
+# _POWERS[k] is 10000 ** (2 ** k), squared up on first use
+_POWERS = [TABLE_SIZE]
+_POWERS_LOCK = Lock()
+
+
+def _power(k):
+    if k >= len(_POWERS):
+        with _POWERS_LOCK:
+            while k >= len(_POWERS):
+                _POWERS.append(_POWERS[-1] * _POWERS[-1])
+    return _POWERS[k]
+
+
+def _level(n):
+    """The smallest k with n < 10000 ** (2 ** (k + 1))."""
+    k = 0
+    while _power(k + 1) <= n:
+        k += 1
+    return k
+
+
+def _split_digit_sum(n, k):
+    """Digit sum of 0 <= n < 10000 ** (2 ** (k + 1))."""
+    if k < _SPLIT_LEVEL:
+        total = 0
+        while n:
+            n, chunk = divmod(n, TABLE_SIZE)
+            total += _DIGIT_SUM[chunk]
+        return total
+    high, low = divmod(n, _power(k))
+    return _split_digit_sum(high, k - 1) + _split_digit_sum(low, k - 1)
+
+
+def _split_chunks(n, k, out):
+    """Append the 2 ** (k + 1) base-10000 chunks of n, most significant first."""
+    if k < _SPLIT_LEVEL:
+        chunks = [0] * (2 << k)
+        for i in range(len(chunks) - 1, -1, -1):
+            n, chunks[i] = divmod(n, TABLE_SIZE)
+        out.extend(chunks)
+        return
+    high, low = divmod(n, _power(k))
+    _split_chunks(high, k - 1, out)
+    _split_chunks(low, k - 1, out)
+
+
+# =============================================================================
+# DIGITS
+# =============================================================================
+
+def digit_sum(n):
+    """Sum of the decimal digits of a non-negative integer."""
+    if n < 0:
+        raise ValueError("Digit sum needs a non-negative integer.")
+    if n < TABLE_SIZE:
+        return _DIGIT_SUM[n]
+    return _split_digit_sum(n, _level(n))
+
+
+def decimal_digits(n, width=1):
+    """
+    The decimal digits of a non-negative integer, most significant first,
+    zero-padded to at least `width` digits.  Works on integers of any
+    size; nothing goes through str().
+    """
+    if n < 0:
+        raise ValueError("Decimal digits need a non-negative integer.")
+    chunk_digits, lengths = _chunk_digits()
+    if n < TABLE_SIZE and width <= 4:
+        return list(chunk_digits[n][-max(lengths[n], width):])
+    if n < TABLE_SIZE:
+        digits = chunk_digits[n]
+    else:
+        chunks = []
+        _split_chunks(n, _level(n), chunks)
+        digits = [d for chunk in chunks for d in chunk_digits[chunk]]
+    lead = 0
+    while lead < len(digits) - 1 and digits[lead] == 0:
+        lead += 1
+    keep = max(len(digits) - lead, width)
+    if keep > len(digits):
+        return [0] * (keep - len(digits)) + list(digits)
+    return list(digits[len(digits) - keep:])
+
+
+def digital_root(n):
+    """
+    Mispar katan mispari: repeatedly sum digits until 1-9.  Only n mod 9
+    is needed, so huge integers cost one linear pass.
+    """
+    if n <= 9:
+        return n
+    return 1 + (n - 1) % 9
+
+
+@lru_cache(maxsize=None)
+def _master_table(size=TABLE_SIZE):
+    """reduce_master for every n below size."""
+    table = list(range(size))
+    for n in range(10, size):
+        if n in MASTER_NUMBERS:
+            continue
+        # One digit-sum step; the sum is smaller than n, so its own entry
+        # is already final unless the step itself landed on a master number.
+        s = _DIGIT_SUM[n]
+        table[n] = s if s in MASTER_NUMBERS else table[s]
+    return tuple(table)
+
+
+def reduce_master(n):
+    """Reduce n to a single digit, preserving master numbers 11, 22, 33."""
+    # Above the table n is never a master number, so the first digit-sum
+    # step is exactly what the reduction loop would do anyway.
+    if n < 0:
+        return n          # nothing to reduce, as with digital_root
+    while n >= TABLE_SIZE:
+        n = digit_sum(n)
+    return _master_table()[n]
+
+
+def preserving_table(preserved, size=100):
+    """
+    Build a lookup table for reduce_preserving: entry n is n itself when
+    n is in `preserved`, otherwise its digital root.
+    """
+    if preserved and max(preserved) >= size:
+        raise ValueError("Table size must exceed every preserved value.")
+    return tuple(n if n in preserved else digital_root(n) for n in range(size))
+
+
+def reduce_preserving(n, table):
+    """Reduce n with a preserving_table, keeping its sacred sums intact."""
+    if 0 <= n < len(table):
+        return table[n]
+    return digital_root(n)
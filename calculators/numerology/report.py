@@ -0,0 +1,497 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# DAY REPORT
+# The full five-method reading for one date, as printed by the date,
+# calendar and year calculators.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+
+from .data import COMBINED_DATA, GREEK_DATA, MONTH_NAMES, lookup_hebrew
+from .dates import days_from_civil, weekday
+from .display import palette, render_subheader, wrap
+from .methods import method_consensus, method_synthesis, reduce_to_single_digit
+from .readings import DateReading
+
+
+class DayReport:
+    """
+    One date's reading with its title, ready to render as ANSI-coloured
+    or plain text.  Both variants come from the same render(), so a caller
+    needing both (the year calculator's terminal and file) looks the date
+    up once and never strips escape codes afterwards.
+    """
+
+    __slots__ = ("title", "reading")
+
+    def __init__(self, title, reading):
+        self.title = title
+        self.reading = reading
+
+    @classmethod
+    def of(cls, month, day, year, hebrew=False, reading=None):
+        """
+        The report for one date.  With hebrew=True the methods read the
+        date's Hebrew calendar day, month (1 = Nisan) and year instead of
+        the Gregorian ones.  A caller walking a range of days
+        (numerology.days) passes each day's DateReading as `reading` so it
+        is not looked up again.
+        """
+        title = f"{MONTH_NAMES[month]} {day}, {year}"
+        if hebrew:
+            from .hebrew import to_hebrew
+            h = to_hebrew(date(year, month, day))
+            title += f"  ·  {h}"
+            reading = DateReading.of(h.month, h.day, h.year)
+        elif reading is None:
+            # Every method depends on the year only through its digit sum, so
+            # the reading comes from the shared (month, day, year-digit-sum) table.
+            reading = DateReading.of(month, day, year)
+        return cls(title, reading)
+
+    def tree(self, width=72):
+        """
+        The report as a RenderTree shared by both variants: plain lines,
+        _Styled lines, summary-table _Rows and cached _Sections.
+        """
+        r = self.reading
+        t = RenderTree(width=width)
+
+        # Method 1: Greek Pythagorean
+        rm1, rd1, ry1, raw1, final1 = r.r_month, r.r_day, r.r_year, r.raw_sum, r.pythagorean
+        greek_num = final1
+
+        # Method 2: Hebrew Standard
+        hebrew_std_num = r.hebrew_standard
+
+        # Method 3: Mispar Katan (All-Digits)
+        digits3, raw3, final3 = r.katan_digits, r.katan_raw, r.katan
+        katan_num = final3
+
+        # Method 4: Full Component (Gadol-inspired)
+        m4, d4, yd4, raw4, final4 = r.month, r.day, r.year_digit_sum, r.full_raw, r.full_component
+        gadol_num = final4
+
+        # Method 5: Bone'eh (Building Value)
+        bm, bd, by_ = r.r_month, r.r_day, r.r_year
+        s1, s2, s3 = r.boneeh_steps
+        boneeh_num = r.boneeh
+
+        # Combined synthesis uses Greek + reduced Hebrew standard
+        combined_num = r.synthesis
+
+        # ── Master header ─────────────────────────────────────────────────────
+
+        t += ["", "=" * width, f"  DATE  ·  {self.title}", "=" * width]
+
+        # ── Summary table ─────────────────────────────────────────────────────
+
+        rule = "  " + "─" * (width - 4)
+        t += ["", rule, f"  {'METHOD':<32}  {'CALCULATION':<22}  {'RESULT':>6}", rule]
+
+        def star(result):
+            return " ★" if result > 9 else ""
+
+        calc1 = f"{rm1}+{rd1}+{ry1}={raw1}→{final1}"
+        t += [
+            _Row("1. Greek Pythagorean", "cyan", calc1, greek_num, "cyan", star(greek_num)),
+            _Row("2. Hebrew Standard (Hechrachi)", "amber", calc1,
+                 hebrew_std_num, "amber", star(hebrew_std_num)),
+            _Row("3. Mispar Katan (All-Digits)", "green", f"digits→{raw3}→{final3}",
+                 katan_num, "green", star(katan_num)),
+            _Row("4. Full Component (Gadol)", "blue", f"{m4}+{d4}+{yd4}={raw4}→{final4}",
+                 gadol_num, "blue", star(gadol_num)),
+            _Row("5. Bone'eh (Building Value)", "magenta", f"3×{bm}+2×{bd}+{by_}={s3}→{boneeh_num}",
+                 boneeh_num, "magenta", star(boneeh_num)),
+            rule,
+            _Row("SYNTHESIS (Greek ⊕ Hebrew Std)", "magenta",
+                 f"{greek_num}+{reduce_to_single_digit(hebrew_std_num)}→{combined_num}",
+                 combined_num, "magenta", ""),
+        ]
+        # How many of the five methods land on the same final value
+        consensus_num, consensus_count = r.consensus
+        agreeing = (f"{consensus_count} of 5 on {consensus_num}" if consensus_count > 1
+                    else "no two agree")
+        t += [_Row("CONSENSUS (methods agreeing)", "bold", agreeing, f"{consensus_count}/5", None, ""),
+              rule, ""]
+        if any(x > 9 for x in [hebrew_std_num, katan_num, gadol_num]):
+            t += [_Styled("dim", "  ★ = sacred number preserved before final reduction"), ""]
+
+        # ── Method sections ───────────────────────────────────────────────────
+        # Each block comes from the section cache; only the one line of
+        # working under the Katan, Gadol and Bone'eh banners is built here.
+
+        digit_display = " + ".join(str(d) for d in digits3)
+        t += [
+            _Section("pythagorean", greek_num),
+            _Section("hebrew_standard", hebrew_std_num),
+
+            _Section("katan_banner", katan_num),
+            _Styled("dim", f"  Date digits: {digit_display} = {raw3}"
+                           f"{' (sacred, preserved)' if katan_num > 9 else ' → ' + str(katan_num)}"),
+            _Section("katan", katan_num),
+
+            _Section("full_component_banner", gadol_num),
+            _Styled("dim", f"  Month {m4} (unreduced)  +  Day {d4} (unreduced)  +  "
+                           f"Year digit-sum {yd4} (not pre-reduced)  =  {raw4}"
+                           f"{' (sacred, preserved)' if gadol_num > 9 else ' → ' + str(gadol_num)}"),
+            _Section("full_component", gadol_num),
+
+            _Section("boneeh_banner", boneeh_num),
+            _Styled("dim",
+                f"  Components: Month → {bm}   Day → {bd}   Year → {by_}\n"
+                f"  Step 1 (month):  prev_orig=0;       running = 0 + {bm} = {s1}\n"
+                f"  Step 2 (day):    prev_orig={bm};      running = {s1} + ({bm}+{bd}) = {s2}\n"
+                f"  Step 3 (year):   prev_orig={bm}+{bd}={bm+bd}; running = {s2} + ({bm}+{bd}+{by_}) = {s3}  →  {boneeh_num}"),
+            _Section("boneeh", boneeh_num),
+
+            _Section("synthesis", (greek_num, hebrew_std_num)), "", "",
+        ]
+        return t
+
+    def render(self, colour=True, width=72):
+        """The full five-method report as text, ANSI-coloured or plain."""
+        return self.tree(width).render(colour)
+
+    def render_both(self, width=72):
+        """(coloured, plain): both variants of the report from one render tree."""
+        return self.tree(width).render_both()
+
+
+# =============================================================================
+# RENDER TREE
+# =============================================================================
+# A report is built once as a list of nodes, then emitted per colour mode.
+# Summary-table columns are padded by their visible text, so the plain
+# variant lines up exactly as the coloured one does on screen.
+
+class _Styled(namedtuple("_Styled", "style text")):
+    """A line in one Palette style."""
+
+    __slots__ = ()
+
+
+class _Row(namedtuple("_Row", "label label_style calc result result_style sacred")):
+    """A summary-table row; result_style None leaves the result bold only."""
+
+    __slots__ = ()
+
+
+class _Section(namedtuple("_Section", "name value")):
+    """A block from the section cache."""
+
+    __slots__ = ()
+
+
+class _CompactRow(namedtuple("_CompactRow", "lead values note")):
+    """A compact calendar row: date text, one value per column, Hebrew date note."""
+
+    __slots__ = ()
+
+
+class RenderTree(list):
+    """Render nodes for one block of output, emitted in either colour mode."""
+
+    __slots__ = ("width",)
+
+    def __init__(self, nodes=(), width=72):
+        super().__init__(nodes)
+        self.width = width
+
+    def render(self, colour=True):
+        """The text, ANSI-coloured or plain; a final "" node ends it with a newline."""
+        return _emit(self, colour, self.width)
+
+    def render_both(self):
+        """(coloured, plain)."""
+        return self.render(True), self.render(False)
+
+
+def _emit(tree, colour, width):
+    p = palette(colour)
+    out = []
+    for node in tree:
+        kind = type(node)
+        if kind is str:
+            out.append(node)
+        elif kind is _Section:
+            out.append(render_section(node.name, node.value, width, colour))
+        elif kind is _Styled:
+            out.append(getattr(p, node.style)(node.text))
+        elif kind is _CompactRow:
+            out.append(node.lead + _compact_cells(node.values, colour) + node.note)
+        else:
+            result = str(node.result)
+            if node.result_style:
+                result = getattr(p, node.result_style)(result)
+            out.append(f"  {getattr(p, node.label_style)(node.label)}{' ' * (34 - len(node.label))}"
+                       f"  {p.dim(node.calc)}{' ' * (13 - len(node.calc))}"
+                       f"  {p.bold(result)}{node.sacred}")
+    return "\n".join(out)
+
+
+def calculate_day(month, day, year, hebrew=False, reading=None, colour=True, file=None):
+    """
+    Run all five numerology methods for a single date and print results
+    to `file` (stdout by default), ANSI-coloured unless colour=False.
+    hebrew and reading are as for DayReport.of.
+    """
+    report = DayReport.of(month, day, year, hebrew, reading)
+    print(report.render(colour), end="", file=file)
+
+
+# =============================================================================
+# SECTION CACHE
+# =============================================================================
+# Below the summary table a day's report depends on the date only through
+# each method's value, apart from one line of working per method, so there
+# are only a few dozen distinct blocks.  Each is rendered once per process
+# and (section, value, width, colour mode), then reused by every later day.
+
+def _described(color_fn, title, width, *paragraphs):
+    """A banner, then each paragraph after a blank line."""
+    lines = [render_subheader(title, color_fn, width)]
+    for paragraph in paragraphs:
+        lines += ["", paragraph]
+    return "\n".join(lines)
+
+
+def _banner(color_fn, title, width):
+    """A banner followed by a blank line, for a line of working below it."""
+    return render_subheader(title, color_fn, width) + "\n"
+
+
+def _preserved(value):
+    return " (sacred sum preserved)" if value > 9 else ""
+
+
+def _render_pythagorean(value, width, p):
+    g = GREEK_DATA.get(value, GREEK_DATA[9])
+    return _described(
+        p.cyan, f"METHOD 1 · GREEK PYTHAGOREAN (ISOPSEPHY)  —  {value}  ·  {g['name']}", width,
+        wrap(g["descriptor"], width),
+        p.dim(wrap(f"Source note: {g['note']}", width)))
+
+
+def _render_hebrew_standard(value, width, p):
+    h = lookup_hebrew(value)
+    return _described(
+        p.amber, f"METHOD 2 · HEBREW STANDARD (MISPAR HECHRACHI)  —  {value}  ·  "
+                 f"{h['name']}{_preserved(value)}", width,
+        wrap(h["descriptor"], width),
+        p.dim(wrap(f"Source note: {h['note']}", width)))
+
+
+def _render_katan_banner(value, width, p):
+    h = lookup_hebrew(value)
+    return _banner(
+        p.green, f"METHOD 3 · MISPAR KATAN (ALL-DIGITS SUM)  —  {value}  ·  "
+                 f"{h['name']}{_preserved(value)}", width)
+
+
+def _render_katan(value, width, p):
+    h = lookup_hebrew(value)
+    return "\n".join(("",
+        wrap(
+            "Mispar Katan sums all individual digits of the date without any "
+            "intermediate component reduction, treating the full MMDDYYYY string "
+            "as a sequence of values. Each zero is present but contributes nothing "
+            "to the total, in keeping with the documented principle that this method "
+            "'truncates all of the zeros.'", width),
+        "", wrap(h["descriptor"], width),
+        "", p.dim(wrap(f"Source note: {h['note']}", width))))
+
+
+def _render_full_component_banner(value, width, p):
+    h = lookup_hebrew(value)
+    return _banner(
+        p.blue, f"METHOD 4 · FULL COMPONENT (MISPAR GADOL-INSPIRED)  —  {value}  ·  "
+                f"{h['name']}{_preserved(value)}", width)
+
+
+def _render_full_component(value, width, p):
+    h = lookup_hebrew(value)
+    return "\n".join(("",
+        wrap(
+            "In mispar gadol, larger letter forms (the 'final' forms of five Hebrew "
+            "letters) retain values from 500 to 900 rather than being reduced. "
+            "Applied to a date, this method preserves the full magnitudes of month "
+            "and day as they are -- not pre-collapsing them to a single digit -- "
+            "and sums the year's digits without early reduction, keeping the larger "
+            "intermediate value before a single final reduction.", width),
+        "", wrap(h["descriptor"], width),
+        "", p.dim(wrap(f"Source note: {h['note']}", width))))
+
+
+def _render_boneeh_banner(value, width, p):
+    return _banner(p.magenta, f"METHOD 5 · BONE'EH (BUILDING VALUE)  —  {value}", width)
+
+
+def _render_boneeh(value, width, p):
+    g = GREEK_DATA.get(value, GREEK_DATA[9])   # bone'eh is a structural method
+    h = lookup_hebrew(value)
+    return "\n".join(("",
+        wrap(
+            "Bone'eh (building value) walks through each 'letter' of a word and "
+            "at each step adds the cumulative sum of all ORIGINAL letter values seen "
+            "so far plus the current letter value to a running total -- not the "
+            "bone'eh total itself. This makes the result sensitive to sequence: "
+            "earlier components carry more cumulative weight, just as the first "
+            "letters of a Hebrew word shape the resonance of those that follow. "
+            "The month, as the first 'letter' of the date, is thus the heaviest "
+            "contributor (weight 3x), the day next (2x), and the year last (1x).", width),
+        "", f"  {p.magenta(p.bold(str(value)))}  Greek: {g['name']}  |  Hebrew: {h['name']}",
+        "", wrap(g["descriptor"], width)))
+
+
+def _render_synthesis(value, width, p):
+    greek_num, hebrew_std_num = value
+    combined_num = method_synthesis(greek_num, hebrew_std_num)
+    cd = COMBINED_DATA.get(combined_num, COMBINED_DATA[9])
+    return _described(
+        p.magenta, f"SYNTHESIS (GREEK ⊕ HEBREW STANDARD)  —  {combined_num}  ·  {cd['name']}", width,
+        wrap(
+            f"The Greek Pythagorean value ({greek_num}) and the Hebrew Standard value "
+            f"({hebrew_std_num}, reduced to "
+            f"{reduce_to_single_digit(hebrew_std_num)}) are combined and reduced to "
+            f"a single synthesis number: {combined_num}.", width),
+        wrap(cd["descriptor"], width))
+
+
+_RENDERERS = {
+    "pythagorean":           _render_pythagorean,
+    "hebrew_standard":       _render_hebrew_standard,
+    "katan_banner":          _render_katan_banner,
+    "katan":                 _render_katan,
+    "full_component_banner": _render_full_component_banner,
+    "full_component":        _render_full_component,
+    "boneeh_banner":         _render_boneeh_banner,
+    "boneeh":                _render_boneeh,
+    "synthesis":             _render_synthesis,   # value is (greek, hebrew standard)
+}
+
+
+@lru_cache(maxsize=None)
+def render_section(section, value, width=72, colour=True):
+    """
+    One block of the day report as text, rendered once per process for
+    each (section, value, width, colour mode).  Sections are named as in
+    _RENDERERS; the *_banner sections end with a blank line, ready for a
+    line of working.
+    """
+    render = _RENDERERS.get(section)
+    if render is None:
+        raise ValueError(f"Unknown section: {section}. Use one of {', '.join(_RENDERERS)}.")
+    return render(value, width, palette(colour))
+
+
+# =============================================================================
+# COMPACT CALENDAR
+# =============================================================================
+# The calendar and year calculators' --compact mode: one aligned row per
+# day with the five method values, sacred markers, synthesis and
+# consensus, and the meaning of every value seen listed once at the end.
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# (heading, reading field, style) per value column
+_COMPACT_COLUMNS = (
+    ("GREEK",   "pythagorean",     "cyan"),
+    ("HEBREW",  "hebrew_standard", "amber"),
+    ("KATAN",   "katan",           "green"),
+    ("GADOL",   "full_component",  "blue"),
+    ("BONE'EH", "boneeh",          "magenta"),
+    ("SYN",     "synthesis",       "magenta"),
+)
+
+# Legend groups: heading, the columns whose values it explains, meanings
+_LEGEND_GROUPS = (
+    ("GREEK AND BONE'EH  ·  Greek Pythagorean meanings", ("pythagorean", "boneeh"),
+     lambda n: GREEK_DATA.get(n, GREEK_DATA[9])["name"]),
+    ("HEBREW, KATAN AND GADOL  ·  Hebrew meanings", ("hebrew_standard", "katan", "full_component"),
+     lambda n: lookup_hebrew(n)["name"]),
+    ("SYNTHESIS  ·  Greek ⊕ Hebrew Standard", ("synthesis",),
+     lambda n: COMBINED_DATA.get(n, COMBINED_DATA[9])["name"]),
+)
+
+
+# The five method values and the synthesis of a reading, in column order
+_COMPACT_FIELDS = tuple(field for _, field, _ in _COMPACT_COLUMNS)
+_compact_values = attrgetter(*_COMPACT_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _compact_cell(column, value, colour):
+    """One value column of a compact row with its sacred marker."""
+    text = getattr(palette(colour), _COMPACT_COLUMNS[column][2])(f"{value:>7}")
+    return text + ("★" if value > 9 else " ")
+
+
+@lru_cache(maxsize=None)
+def _compact_cells(values, colour):
+    """
+    The value and consensus columns of a compact row, rendered once per
+    process for each combination of values and colour mode.
+    """
+    count = method_consensus(*values[:5])[1]
+    agree = f"{count}/5".rjust(5)
+    if count == 5:
+        agree = palette(colour).bold(agree)
+    return "".join([_compact_cell(i, v, colour) for i, v in enumerate(values)]) + agree
+
+
+class CompactCalendar:
+    """
+    Compact rows for a run of days.  Each row() returns a RenderTree and
+    remembers the values shown, so legend() lists each meaning once.
+    """
+
+    def __init__(self, width=72):
+        self.width = width
+        self._seen = tuple(set() for _ in _COMPACT_COLUMNS)   # values shown, per column
+
+    def header(self):
+        """Column headings between two rules."""
+        rule = "  " + "─" * (self.width - 4)
+        headings = "".join(f"{heading:>7} " for heading, _, _ in _COMPACT_COLUMNS)
+        return RenderTree(["", rule, f"  {'DATE':<10}  {'DAY':<3}{headings}{'AGREE':>5}", rule, ""],
+                          self.width)
+
+    def row(self, month, day, year, hebrew=False, reading=None):
+        """
+        One day's row.  With hebrew=True the methods read the Hebrew
+        calendar date, which is shown after the row.
+        """
+        note = ""
+        if hebrew:
+            from .hebrew import to_hebrew
+            h = to_hebrew(date(year, month, day))
+            note = f"  {h}"
+            reading = DateReading.of(h.month, h.day, h.year)
+        elif reading is None:
+            reading = DateReading.of(month, day, year)
+
+        values = _compact_values(reading)
+        for seen, value in zip(self._seen, values):
+            seen.add(value)
+        lead = (f"  {month:02d}-{day:02d}-{year:04d}  "
+                f"{_WEEKDAYS[weekday(days_from_civil(year, month, day))]}")
+        return RenderTree([_CompactRow(lead, values, note), ""], self.width)
+
+    def legend(self):
+        """The meaning of every value shown so far, grouped by tradition."""
+        rule = "  " + "─" * (self.width - 4)
+        t = RenderTree(["", rule,
+                        "  LEGEND  ·  ★ = sacred number preserved before final reduction",
+                        _Styled("dim", "  AGREE = how many of the five methods share one final value"),
+                        rule], self.width)
+        for heading, fields, meaning in _LEGEND_GROUPS:
+            values = sorted(set().union(*(self._seen[_COMPACT_FIELDS.index(f)] for f in fields)))
+            if not values:
+                continue
+            t.append(_Styled("bold", f"  {heading}"))
+            t += [f"  {n:>5}  {meaning(n)}" for n in values]
+        t += [rule, ""]
+        return t
@@ -0,0 +1,140 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# RUNS, GAPS AND PATTERNS  (requires NumPy)
+# Streaks in a method's day-by-day output over any date range:
+#
+#   longest_runs("synthesis", date(2000, 1, 1), date(2099, 12, 31), value=7)
+#   gaps("katan", 26, date(2025, 1, 1), date(2025, 12, 31))
+#   patterns("hebrew_standard", date(2026, 1, 1), date(2026, 12, 31), period=2)
+#
+# The range is evaluated once as a vector (numerology.columns), then every
+# query is a single linear pass of element-wise comparisons: a run starts
+# wherever a day differs from the day before, a gap is a run of days that
+# miss the value, and a period-p pattern is a run of days that equal the
+# day p before.  Also available from the command line:
+#
+#   python3 -m numerology runs synthesis --from 01-01-2000 --to 12-31-2099
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from .columns import ReadingColumns
+from .table import METHODS
+
+
+class Run(namedtuple("Run", "start end length value")):
+    """
+    A maximal stretch of days, start and end inclusive.  value is the
+    repeated result for a run, None for a gap, and the repeating motif
+    (a tuple) for a pattern.
+    """
+
+    __slots__ = ()
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+
+def run_lengths(values):
+    """(starts, lengths, values) of the maximal runs of equal values in an array."""
+    values = np.asarray(values)
+    if values.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, values
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    lengths = np.diff(np.append(starts, values.size))
+    return starts, lengths, values[starts]
+
+
+def true_runs(mask):
+    """(starts, lengths) of the maximal runs of True in a boolean array."""
+    starts, lengths, values = run_lengths(np.asarray(mask, dtype=bool))
+    return starts[values], lengths[values]
+
+
+# =============================================================================
+# DATE RANGES
+# =============================================================================
+
+def _column(method, start, end):
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+    if start > end:
+        raise ValueError("The range must start on or before its last day.")
+    return getattr(ReadingColumns.for_range(start, end), method)
+
+
+def _as_runs(origin, starts, lengths, values):
+    first = origin.toordinal()
+    return [Run(date.fromordinal(first + s), date.fromordinal(first + s + n - 1), n, v)
+            for s, n, v in zip(starts.tolist(), lengths.tolist(), values)]
+
+
+def _longest(starts, lengths, top):
+    """Indexes of the `top` longest runs, longest first, then by date."""
+    order = np.lexsort((starts, -lengths))
+    return order if top is None else order[:top]
+
+
+def runs(method, start, end, value=None, min_length=2):
+    """
+    Every maximal run of at least min_length consecutive days, from start
+    to end (datetime.date, inclusive), on which `method` gives the same
+    result; only runs of `value` if one is given.  In date order.
+    """
+    column = _column(method, start, end)
+    starts, lengths, values = run_lengths(column)
+    keep = lengths >= min_length
+    if value is not None:
+        keep &= values == value
+    return _as_runs(start, starts[keep], lengths[keep], values[keep].tolist())
+
+
+def longest_runs(method, start, end, value=None, top=10):
+    """The `top` longest runs (all of them if top is None), longest first."""
+    column = _column(method, start, end)
+    starts, lengths, values = run_lengths(column)
+    if value is not None:
+        keep = values == value
+        starts, lengths, values = starts[keep], lengths[keep], values[keep]
+    pick = _longest(starts, lengths, top)
+    return _as_runs(start, starts[pick], lengths[pick], values[pick].tolist())
+
+
+def gaps(method, value, start, end, top=None):
+    """
+    Maximal stretches of days from start to end on which `method` never
+    gives `value`, longest first (the `top` longest if given).
+    """
+    column = _column(method, start, end)
+    starts, lengths = true_runs(column != value)
+    pick = _longest(starts, lengths, top)
+    return _as_runs(start, starts[pick], lengths[pick], [None] * len(pick))
+
+
+def patterns(method, start, end, period, min_repeats=2, top=None):
+    """
+    Maximal stretches where a `period`-day motif repeats at least
+    min_repeats times in a row, longest first (the `top` longest if given).
+    Runs of a single repeated value are left to runs().
+    """
+    if period < 2:
+        raise ValueError("A pattern period must be at least 2 days; use runs() for 1.")
+    column = _column(method, start, end)
+    # Day i + period repeats day i: a stretch of n such days holds
+    # period + n days following one motif.
+    starts, lengths = true_runs(column[period:] == column[:-period])
+    lengths = lengths + period
+    keep = lengths >= period * min_repeats
+    starts, lengths = starts[keep], lengths[keep]
+    # A motif of one repeated value is a plain run
+    constant = np.ones(len(starts), dtype=bool)
+    for k in range(1, period):
+        constant &= column[starts + k] == column[starts]
+    starts, lengths = starts[~constant], lengths[~constant]
+    pick = _longest(starts, lengths, top)
+    motifs = [tuple(column[s:s + period].tolist()) for s in starts[pick].tolist()]
+    return _as_runs(start, starts[pick], lengths[pick], motifs)
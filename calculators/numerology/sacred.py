@@ -0,0 +1,142 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# SACRED-DATE INDEX
+# Every date in 0001-9999 where Hebrew Standard, Mispar Katan or Full
+# Component preserves a sacred sum (13, 18, 26, 36, 40, 49, 50, 70), written
+# once to disk and memory-mapped by readers:
+#
+#   python3 -m numerology build-sacred-index        (writes DEFAULT_INDEX_PATH)
+#
+#   index = SacredIndex.open()
+#   index.dates("katan", 26, date(2000, 1, 1), date(2099, 12, 31))
+#
+# File layout (native byte order, recorded in the header):
+#   header     MAGIC, byte order, number of keys
+#   directory  one (method, value, offset, count) entry per key
+#   ordinals   uint32 day ordinals (date.toordinal()), sorted within each key,
+#              starting at the next 8-byte boundary
+#
+# Lookups binary-search the ordinals of one key inside the mapping, so a
+# query touches only the pages it needs and never scans the calendar.
+# ─────────────────────────────────────────────────────────────────────────────
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from types import MappingProxyType
+
+from .methods import HEBREW_SACRED_EXTENDED, HEBREW_SACRED_STANDARD
+from .query import find_dates
+
+
+SACRED_METHODS = MappingProxyType({
+    "hebrew_standard": HEBREW_SACRED_STANDARD,
+    "katan":           HEBREW_SACRED_EXTENDED,
+    "full_component":  HEBREW_SACRED_EXTENDED,
+})
+
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.expanduser("~"), ".numerology", "sacred-dates.idx")
+
+MAGIC = b"NUMSACR1"
+_HEADER = struct.Struct("=8s8sI")      # magic, byte order, key count
+_ENTRY = struct.Struct("=16sHII")      # method, value, offset, count
+
+
+def _data_start(n_keys):
+    end = _HEADER.size + n_keys * _ENTRY.size
+    return (end + 7) // 8 * 8
+
+
+_FIRST = date(1, 1, 1)
+_LAST = date(9999, 12, 31)
+
+
+def build_index(path=DEFAULT_INDEX_PATH):
+    """Compute every sacred date in 0001-9999 and write the index to path."""
+    keys = []
+    ordinals = array("I")
+    for method, sacred in SACRED_METHODS.items():
+        for value in sorted(sacred):
+            offset = len(ordinals)
+            ordinals.extend(d.toordinal() for d in find_dates(method, value, _FIRST, _LAST))
+            keys.append((method, value, offset, len(ordinals) - offset))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, sys.byteorder.encode(), len(keys)))
+        for method, value, offset, count in keys:
+            fh.write(_ENTRY.pack(method.encode(), value, offset, count))
+        fh.write(b"\0" * (_data_start(len(keys)) - fh.tell()))
+        ordinals.tofile(fh)
+    os.replace(tmp_path, path)   # readers never see a half-written index
+    return path
+
+
+class SacredIndex:
+    """Read-only, memory-mapped view of a sacred-date index file."""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder, n_keys = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sacred-date index.")
+        if byteorder.rstrip(b"\0").decode() != sys.byteorder:
+            raise ValueError(f"{path} was built on a machine with another byte "
+                             f"order; rebuild it here.")
+        self._keys = {}
+        for i in range(n_keys):
+            method, value, offset, count = _ENTRY.unpack_from(
+                self._map, _HEADER.size + i * _ENTRY.size)
+            self._keys[(method.rstrip(b"\0").decode(), value)] = (offset, count)
+        self._ordinals = memoryview(self._map)[_data_start(n_keys):].cast("I")
+
+    @classmethod
+    def open(cls, path=DEFAULT_INDEX_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"No sacred-date index at {path}. "
+                f"Build one with: python3 -m numerology build-sacred-index")
+        return cls(path)
+
+    def keys(self):
+        """The indexed (method, sacred value) pairs."""
+        return list(self._keys)
+
+    def _span(self, method, value, start, end):
+        if method not in SACRED_METHODS:
+            raise ValueError(f"{method} preserves no sacred sums. Use one of "
+                             f"{', '.join(SACRED_METHODS)}.")
+        offset, count = self._keys.get((method, value), (0, 0))
+        run = self._ordinals[offset:offset + count]
+        lo = bisect_left(run, start.toordinal()) if start else 0
+        hi = bisect_right(run, end.toordinal()) if end else count
+        return run, lo, hi
+
+    def count(self, method, value, start=None, end=None):
+        """Number of dates from start to end (inclusive) where `method` preserves `value`."""
+        _, lo, hi = self._span(method, value, start, end)
+        return hi - lo
+
+    def dates(self, method, value, start=None, end=None):
+        """Dates from start to end (inclusive) where `method` preserves `value`, in order."""
+        run, lo, hi = self._span(method, value, start, end)
+        return [date.fromordinal(o) for o in run[lo:hi]]
+
+    def close(self):
+        self._ordinals.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,133 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# TIME SLOTS  (requires NumPy)
+# The five methods and the synthesis down to the minute, for appointment
+# scheduling: all 1,440 slots of a day in one vectorized pass, and the
+# best of them ranked.
+#
+#   slots = day_slots(2, 28, 2026)          # method -> array of 1,440 values
+#   rank_slots(2, 28, 2026, target=8)       # the slots where most methods hit 8
+#   method_at("boneeh", 2, 28, 2026, 14, 30)
+#
+# Every method is a weighted sum over (month, day, year, hour, minute), and
+# hour and minute add nothing at 00:00, so a slot's raw sum is the day's
+# raw sum plus a time-of-day part that never changes.  Those 1,440 time
+# parts are computed once per method; a day then costs one scalar reading
+# and one vector addition per method.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import digital_roots, reduce_preserving
+from .sacred import SACRED_METHODS
+from .reduction import digital_root
+from .specs import TIME_SPECS, compile_vector, reduction_table
+from .table import METHODS
+
+
+SLOTS_PER_DAY = 24 * 60
+
+HOURS = np.repeat(np.arange(24), 60)
+MINUTES = np.tile(np.arange(60), 24)
+HOURS.flags.writeable = MINUTES.flags.writeable = False
+
+
+class Slot(namedtuple("Slot", "hour minute score values")):
+    """One ranked slot: its time, its score and every method's value."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.hour:02d}:{self.minute:02d}"
+
+
+def _check_method(method):
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}. Use one of {', '.join(METHODS)}.")
+
+
+@lru_cache(maxsize=None)
+def _time_parts(method):
+    """Raw contribution of hour and minute for every slot of the day."""
+    raw, _ = compile_vector(TIME_SPECS[method])(0, 0, 0, HOURS, MINUTES)
+    raw.flags.writeable = False
+    return raw
+
+
+@lru_cache(maxsize=None)
+def _time_max(method):
+    return int(_time_parts(method).max())
+
+
+# Final value for every raw sum below this, per method.  Raw sums stay
+# under it unless the year's digit sum is unusually large.
+_LOOKUP_SIZE = 512
+
+
+@lru_cache(maxsize=None)
+def _final_lookup(method):
+    table = reduction_table(TIME_SPECS[method])
+    lookup = np.array(table + tuple(digital_root(n) for n in range(len(table), _LOOKUP_SIZE)),
+                      dtype=np.int64)
+    lookup.flags.writeable = False
+    return lookup
+
+
+@lru_cache(maxsize=None)
+def _sacred_lookup(method):
+    """Boolean table: is this final value one of the method's sacred sums?"""
+    lookup = np.zeros(_LOOKUP_SIZE, dtype=bool)
+    lookup[sorted(SACRED_METHODS[method])] = True
+    lookup.flags.writeable = False
+    return lookup
+
+
+def _finals(method, month, day, year):
+    day_raw, _ = TIME_SPECS[method](month, day, year, 0, 0)
+    times = _time_parts(method)
+    raw = day_raw + times
+    if day_raw + _time_max(method) < _LOOKUP_SIZE:
+        return _final_lookup(method)[raw]
+    return reduce_preserving(raw, reduction_table(TIME_SPECS[method]))
+
+
+def day_slots(month, day, year):
+    """
+    Every method's final value for each minute of one day: a dict of
+    method -> int array of 1,440 values, slot i being i // 60 : i % 60.
+    """
+    slots = {method: _finals(method, month, day, year) for method in TIME_SPECS}
+    slots["synthesis"] = digital_roots(
+        slots["pythagorean"] + digital_roots(slots["hebrew_standard"]))
+    return slots
+
+
+def method_at(method, month, day, year, hour, minute):
+    """One method's final value (or the synthesis) at one minute of one day."""
+    _check_method(method)
+    if method == "synthesis":
+        greek = TIME_SPECS["pythagorean"](month, day, year, hour, minute)[1]
+        hebrew = TIME_SPECS["hebrew_standard"](month, day, year, hour, minute)[1]
+        return digital_root(greek + digital_root(hebrew))
+    return TIME_SPECS[method](month, day, year, hour, minute)[1]
+
+
+def rank_slots(month, day, year, target=None, top=10):
+    """
+    The `top` best slots of a day, best first.  With a target value, a
+    slot scores one point per method (and the synthesis) landing on it;
+    without one, one point per method preserving a sacred sum.  Ties go
+    to the slot with more sacred sums, then to the earlier slot.
+    """
+    slots = day_slots(month, day, year)
+    sacred = sum(_sacred_lookup(m)[slots[m]].astype(np.int64) for m in SACRED_METHODS)
+    if target is None:
+        score = sacred
+    else:
+        score = sum((slots[m] == target).astype(np.int64) for m in METHODS)
+    best = np.lexsort((-sacred, -score))[:top]
+    return [Slot(int(HOURS[i]), int(MINUTES[i]), int(score[i]),
+                 {m: int(slots[m][i]) for m in METHODS})
+            for i in best]
@@ -0,0 +1,165 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# METHOD SPECS
+# A date method described as data instead of code: how much each of month,
+# day, year -- and optionally hour and minute -- weighs, how each is
+# transformed before the sum, and whether the sum is reduced, keeping which
+# sacred values:
+#
+#   house = MethodSpec("house", weights=(2, 1, 3), transforms=("root", "face", "digits"),
+#                      preserved={13, 26})
+#   house(2, 28, 2026)                        # (raw, final) for one date
+#   house.evaluate(months, days, years)       # (raw, final) arrays, NumPy
+#
+# Transforms:  "face"    the component as written (2026)
+#              "digits"  its digit sum (10)
+#              "root"    its digital root (1)
+#
+# A spec compiles once into a plain scalar function and, on first use, a
+# vectorized kernel built from the numerology.batch primitives.  The five
+# built-in methods are specs too (BUILTIN_SPECS), and both compiled forms
+# agree with the method_* functions on every date.  TIME_SPECS extends them
+# down to the minute (numerology.slots).
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from .methods import HEBREW_SACRED_EXTENDED, HEBREW_SACRED_STANDARD
+from .reduction import digit_sum, digital_root, preserving_table, reduce_preserving
+
+
+COMPONENTS = ("month", "day", "year", "hour", "minute")
+TRANSFORMS = ("face", "digits", "root")
+
+_SCALAR_TRANSFORMS = MappingProxyType({
+    "face":   None,
+    "digits": digit_sum,
+    "root":   digital_root,
+})
+
+
+class MethodSpec(namedtuple("MethodSpec", "name weights transforms reduce preserved")):
+    """
+    A declarative date method: final = reduce(sum of weight * transform(part))
+    over (month, day, year), or (month, day, year, hour, minute) when given
+    five weights.  With reduce=False the raw sum is the result.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, name, weights=(1, 1, 1), transforms=("root", "root", "root"),
+                reduce=True, preserved=()):
+        weights, transforms = tuple(weights), tuple(transforms)
+        preserved = frozenset(preserved)
+        if len(weights) not in (3, 5) or len(transforms) != len(weights):
+            raise ValueError("A method spec needs one weight and one transform "
+                             "for each of month, day, year and, optionally, "
+                             "hour and minute.")
+        if any(not isinstance(w, int) or w < 0 for w in weights):
+            raise ValueError("Weights must be non-negative integers.")
+        for t in transforms:
+            if t not in TRANSFORMS:
+                raise ValueError(f"Unknown transform: {t}. Use one of {', '.join(TRANSFORMS)}.")
+        if preserved and not reduce:
+            raise ValueError("Preserved values only apply when the sum is reduced.")
+        return super().__new__(cls, name, weights, transforms, reduce, preserved)
+
+    @property
+    def components(self):
+        return COMPONENTS[:len(self.weights)]
+
+    def __call__(self, *parts):
+        """(raw, final) for one date: month, day, year[, hour, minute]."""
+        return compile_scalar(self)(*parts)
+
+    def evaluate(self, *parts):
+        """(raw, final) arrays for broadcastable arrays of dates (requires NumPy)."""
+        return compile_vector(self)(*parts)
+
+
+@lru_cache(maxsize=None)
+def reduction_table(spec):
+    """The preserving_table a reducing spec uses for its final value."""
+    size = max(100, max(spec.preserved, default=0) + 1)
+    return preserving_table(spec.preserved, size)
+
+
+def _check_parts(spec, parts):
+    if len(parts) != len(spec.weights):
+        raise TypeError(f"{spec.name} takes {', '.join(spec.components)}; "
+                        f"got {len(parts)} values.")
+
+
+@lru_cache(maxsize=None)
+def compile_scalar(spec):
+    """A function (month, day, year[, hour, minute]) -> (raw, final) for one spec."""
+    terms = tuple((w, _SCALAR_TRANSFORMS[t]) for w, t in zip(spec.weights, spec.transforms))
+    table = reduction_table(spec) if spec.reduce else None
+
+    def method(*parts):
+        _check_parts(spec, parts)
+        raw = 0
+        for (w, f), part in zip(terms, parts):
+            raw += w * (f(part) if f else part)
+        if table is None:
+            return raw, raw
+        return raw, reduce_preserving(raw, table)
+
+    method.__name__ = f"method_{spec.name}"
+    return method
+
+
+@lru_cache(maxsize=None)
+def compile_vector(spec):
+    """A NumPy kernel (months, days, years[, hours, minutes]) -> (raw, final) arrays."""
+    import numpy as np
+    from . import batch
+
+    transforms = {
+        "face":   lambda a: a,
+        "digits": batch.digit_sums,
+        "root":   batch.digital_roots,
+    }
+    terms = tuple((w, transforms[t]) for w, t in zip(spec.weights, spec.transforms))
+    table = reduction_table(spec) if spec.reduce else None
+
+    def kernel(*parts):
+        _check_parts(spec, parts)
+        parts = (np.ravel(a).astype(np.int64) for a in np.broadcast_arrays(*parts))
+        raw = sum(w * f(a) for (w, f), a in zip(terms, parts))
+        if table is None:
+            return raw, raw
+        return raw, batch.reduce_preserving(raw, table)
+
+    kernel.__name__ = f"kernel_{spec.name}"
+    return kernel
+
+
+# The five methods as specs.  (The synthesis combines two methods' results,
+# so it stays a function of its own.)
+BUILTIN_SPECS = MappingProxyType({
+    "pythagorean":     MethodSpec("pythagorean"),
+    "hebrew_standard": MethodSpec("hebrew_standard", preserved=HEBREW_SACRED_STANDARD),
+    "katan":           MethodSpec("katan", transforms=("digits", "digits", "digits"),
+                                  preserved=HEBREW_SACRED_EXTENDED),
+    "full_component":  MethodSpec("full_component", transforms=("face", "face", "digits"),
+                                  preserved=HEBREW_SACRED_EXTENDED),
+    "boneeh":          MethodSpec("boneeh", weights=(3, 2, 1)),
+})
+
+
+# The five methods down to the minute: hour and minute join as two more
+# components, transformed like the day (HHMM digits for Mispar Katan, face
+# value for Full Component), and Bone'eh builds over all five letters.
+TIME_SPECS = MappingProxyType({
+    "pythagorean":     MethodSpec("pythagorean", (1,) * 5, ("root",) * 5),
+    "hebrew_standard": MethodSpec("hebrew_standard", (1,) * 5, ("root",) * 5,
+                                  preserved=HEBREW_SACRED_STANDARD),
+    "katan":           MethodSpec("katan", (1,) * 5, ("digits",) * 5,
+                                  preserved=HEBREW_SACRED_EXTENDED),
+    "full_component":  MethodSpec("full_component", (1,) * 5,
+                                  ("face", "face", "digits", "face", "face"),
+                                  preserved=HEBREW_SACRED_EXTENDED),
+    "boneeh":          MethodSpec("boneeh", (5, 4, 3, 2, 1), ("root",) * 5),
+})
@@ -0,0 +1,154 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# RESULT TABLE
+# Every method depends on the year only through its digit sum: Pythagorean,
+# Hebrew Standard and Bone'eh reduce it, Mispar Katan adds it to the month
+# and day digits, and Full Component adds it unreduced.  Years 1-9999 have
+# digit sums 1-36, so there are only 12 x 31 x 37 distinct readings.
+#
+# This module computes each one from the method_* functions themselves the
+# first time a date needs it, and answers any date with two indexes: year ->
+# digit sum, then (month, day, digit sum) -> result.  Years whose digit sum
+# lies beyond the table (10000 and up can exceed 36) are computed once per
+# (month, day, digit sum), and past the largest sacred value the digit sum
+# folds mod 9.
+# ─────────────────────────────────────────────────────────────────────────────
+
+from collections import namedtuple
+from functools import lru_cache
+
+from .methods import (
+    HEBREW_SACRED_EXTENDED, method_boneeh, method_full_component,
+    method_hebrew_standard, method_katan, method_pythagorean, method_synthesis,
+)
+from .reduction import TABLE_SIZE, _DIGIT_SUM, digit_sum
+
+
+MAX_DIGIT_SUM = 36          # digit sum of 9999
+_DS_SPAN = MAX_DIGIT_SUM + 1
+
+
+METHODS = (
+    "pythagorean", "hebrew_standard", "katan", "full_component", "boneeh",
+    "synthesis",
+)
+
+
+class TableEntry(namedtuple("TableEntry", [
+    "pythagorean",       # (r_month, r_day, r_year, raw_sum, final)
+    "hebrew_standard",   # (r_month, r_day, r_year, raw_sum, final)
+    "katan",             # (raw_sum, final) -- the digits depend on the year itself
+    "full_component",    # (month, day, year_digit_sum, raw_sum, final)
+    "boneeh",            # (m, d, y, (step1, step2, step3), final)
+    "synthesis",         # single-digit synthesis number
+])):
+    __slots__ = ()
+
+    def final(self, method):
+        """Final value of one method, named as in METHODS."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method}.")
+        value = getattr(self, method)
+        return value if method == "synthesis" else value[-1]
+
+
+@lru_cache(maxsize=None)
+def representative_years():
+    """The smallest year with each digit sum 0-36."""
+    years = [None] * _DS_SPAN
+    for year in range(TABLE_SIZE):
+        ds = _DIGIT_SUM[year]
+        if years[ds] is None:
+            years[ds] = year
+    return tuple(years)
+
+
+def _compute(month, day, year):
+    pyth = method_pythagorean(month, day, year)
+    hebrew = method_hebrew_standard(month, day, year)
+    _, katan_raw, katan_final = method_katan(month, day, year)
+    return TableEntry(
+        pythagorean=pyth,
+        hebrew_standard=hebrew,
+        katan=(katan_raw, katan_final),
+        full_component=method_full_component(month, day, year),
+        boneeh=method_boneeh(month, day, year),
+        synthesis=method_synthesis(pyth[4], hebrew[4]),
+    )
+
+
+# One slot per (month, day, digit sum), filled on first use so a single
+# date or month costs only the cells it touches.  Entries are pure values:
+# two threads racing on an empty slot compute equal entries and either may
+# be kept, so reads need no lock.
+_TABLE = [None] * (12 * 31 * _DS_SPAN)
+
+
+def _cell(month, day, ds):
+    i = ((month - 1) * 31 + (day - 1)) * _DS_SPAN + ds
+    entry = _TABLE[i]
+    if entry is None:
+        entry = _TABLE[i] = _compute(month, day, representative_years()[ds])
+    return entry
+
+
+def year_digit_sum(year):
+    """Digit sum of a year; a single lookup for years below 10000."""
+    if 0 <= year < TABLE_SIZE:
+        return _DIGIT_SUM[year]
+    return digit_sum(year)
+
+
+def year_with_digit_sum(ds):
+    """Some year whose digit sum is ds (the smallest, for ds up to 36)."""
+    if ds <= MAX_DIGIT_SUM:
+        return representative_years()[ds]
+    # ds % 9 followed by ds // 9 nines
+    return (ds % 9 + 1) * 10 ** (ds // 9) - 1
+
+
+# From this digit sum on no raw sum can land on a sacred value, so a reading
+# sees the digit sum only through ds mod 9 -- apart from the raw sums, which
+# carry ds itself.
+_FOLD_FROM = max(HEBREW_SACRED_EXTENDED)
+
+
+@lru_cache(maxsize=None)
+def _beyond_table(month, day, ds):
+    return _compute(month, day, year_with_digit_sum(ds))
+
+
+def _beyond(month, day, ds):
+    """Readings for a digit sum past the table, folded onto 37-78."""
+    if ds <= _FOLD_FROM:
+        return _beyond_table(month, day, ds)
+    folded = _FOLD_FROM + (ds - _FOLD_FROM) % 9
+    e = _beyond_table(month, day, folded)
+    shift = ds - folded
+    katan_raw, katan = e.katan
+    m, d, _, full_raw, full = e.full_component
+    return e._replace(katan=(katan_raw + shift, katan),
+                      full_component=(m, d, ds, full_raw + shift, full))
+
+
+def lookup_ds(month, day, ds):
+    """Readings for (month, day) in any year whose digit sum is ds."""
+    if month > 12:
+        return _compute(month, day, year_with_digit_sum(ds))
+    if ds > MAX_DIGIT_SUM:
+        return _beyond(month, day, ds)
+    return _cell(month, day, ds)
+
+
+def lookup(month, day, year):
+    """
+    Readings for one date: a TableEntry with every method's result.
+    Day must be 1-31, as accepted by parse_date.  Months beyond 12 (Adar II
+    of a Hebrew leap year is 13) and years whose digit sum lies beyond the
+    table are computed directly.
+    """
+    if month > 12:
+        return _compute(month, day, year)
+    ds = year_digit_sum(year)
+    if ds > MAX_DIGIT_SUM:
+        return _beyond(month, day, ds)
+    return _cell(month, day, ds)